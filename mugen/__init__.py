@@ -1,19 +1,17 @@
 """Quart application package."""
 
-__all__ = ["create_quart_app", "run_clients"]
+__all__ = ["ConfigurationError", "create_quart_app", "run_clients"]
 
 import asyncio
 from importlib import import_module
-import sys
 from types import SimpleNamespace
+from typing import TYPE_CHECKING, Awaitable, Callable
 
 from quart import Quart
 
 from mugen.config import AppConfig
 from mugen.core import di
 from mugen.core.api import api
-from mugen.core.contract.client.matrix import IMatrixClient
-from mugen.core.contract.client.telnet import ITelnetClient
 from mugen.core.contract.extension.ct import ICTExtension
 from mugen.core.contract.extension.ctx import ICTXExtension
 from mugen.core.contract.extension.fw import IFWExtension
@@ -23,6 +21,38 @@ from mugen.core.contract.extension.rag import IRAGExtension
 from mugen.core.contract.extension.rpp import IRPPExtension
 from mugen.core.contract.gateway.logging import ILoggingGateway
 
+# The client contracts are only needed for type hints.
+if TYPE_CHECKING:
+    from mugen.core.contract.client.matrix import IMatrixClient
+    from mugen.core.contract.client.telnet import ITelnetClient
+
+# Map extension types to the interfaces their classes implement.
+_EXTENSION_INTERFACES: dict[str, type] = {
+    "ct": ICTExtension,
+    "ctx": ICTXExtension,
+    "fw": IFWExtension,
+    "ipc": IIPCExtension,
+    "mh": IMHExtension,
+    "rag": IRAGExtension,
+    "rpp": IRPPExtension,
+}
+
+# Names of the supported application environments.
+_VALID_ENVIRONMENTS = frozenset({"default", "development", "testing", "production"})
+
+
+def _index_extension_classes() -> dict[tuple[str, str], type]:
+    """Index the loaded extension classes by extension type and module."""
+    return {
+        (ext_type, x.__module__): x
+        for ext_type, interface in _EXTENSION_INTERFACES.items()
+        for x in interface.__subclasses__()
+    }
+
+
+class ConfigurationError(RuntimeError):
+    """Raised when the application configuration is invalid."""
+
 
 def create_quart_app(
     config: SimpleNamespace = di.container.config,
@@ -37,23 +67,19 @@ def create_quart_app(
         environment = config.mugen.environment
     except AttributeError:
         logger.error("Configuration unavailable.")
-        sys.exit(1)
+        raise ConfigurationError("Configuration unavailable.") from None
 
     logger.debug(f"Configured environment: {environment}.")
-    if environment not in (
-        "default",
-        "development",
-        "testing",
-        "production",
-    ):
+    if environment not in _VALID_ENVIRONMENTS:
         logger.error("Invalid environment name.")
-        sys.exit(1)
+        raise ConfigurationError("Invalid environment name.")
 
     # Create application configuration object.
-    app.config.from_object(AppConfig[environment])
+    app_config = AppConfig[environment]
+    app.config.from_object(app_config)
 
     # Initialize application.
-    AppConfig[environment].init_app(app)
+    app_config.init_app(app)
 
     # Return the built application object.
     return app
@@ -65,28 +91,39 @@ def create_quart_app(
 async def run_clients(app: Quart) -> None:
     """Entrypoint for assistants."""
 
-    # Get logging gateway.
+    # Resolve the configuration and services used below once.
+    config = di.container.config
     logging_gateway = di.container.logging_gateway
 
-    # Do platform checks.
-    tasks = []
-    platforms = di.container.config.mugen.platforms
+    # CT, IPC, and RAG extensions need to be registered
+    # with the IPC and Messaging services.
+    ipc_service = di.container.ipc_service
+    messaging_service = di.container.messaging_service
 
-    try:
-        # Run Matrix assistant.
-        if "matrix" in platforms:
-            tasks.append(asyncio.create_task(run_matrix_client()))
+    # Platform service is needed to check extension support.
+    platform_service = di.container.platform_service
+
+    # Do platform checks.
+    mugen_cfg = config.mugen
+    platforms = mugen_cfg.platforms
 
-        # Run Telnet assistant.
-        if "telnet" in platforms:
-            tasks.append(asyncio.create_task(run_telnet_client()))
+    # Map platforms to the coroutines that run their clients.
+    platform_clients = {
+        "matrix": run_matrix_client,
+        "telnet": run_telnet_client,
+        "whatsapp": run_whatsapp_client,
+    }
 
-        # Run Whatsapp assistant.
-        if "whatsapp" in platforms:
-            tasks.append(asyncio.create_task(run_whatsapp_client()))
+    try:
+        # Get the client runners for the enabled platforms.
+        client_runners = [
+            run_client
+            for platform, run_client in platform_clients.items()
+            if platform in platforms
+        ]
     except TypeError:
         logging_gateway.error("Platforms not configured.")
-        sys.exit(1)
+        raise ConfigurationError("Platforms not configured.") from None
 
     # Load extensions if specified. These include:
     # 1. Conversational Trigger (CT) extensions.
@@ -98,112 +135,99 @@ async def run_clients(app: Quart) -> None:
     extensions = []
 
     # Load core plugins.
-    if di.container.config.mugen.modules.core.plugins is not None:
-        extensions += di.container.config.mugen.modules.core.plugins
+    mugen_modules = mugen_cfg.modules
+    if mugen_modules.core.plugins is not None:
+        extensions += mugen_modules.core.plugins
 
     # Load third party extensions.
-    if di.container.config.mugen.modules.extensions is not None:
-        extensions += di.container.config.mugen.modules.extensions
+    if mugen_modules.extensions is not None:
+        extensions += mugen_modules.extensions
 
     # Wire the plugins/extensions for dependency injection.
     # di.container.wire([x["path"] for x in extensions])
 
-    # CT, IPC, and RAG extensions need to be registered
-    # with the IPC and Messaging services.
-    ipc_service = di.container.ipc_service
-    messaging_service = di.container.messaging_service
-
-    # Platform service is needed to check extension support.
-    platform_service = di.container.platform_service
+    # Map extension types to the service methods that register them.
+    ext_registrars = {
+        "ct": messaging_service.register_ct_extension,
+        "ctx": messaging_service.register_ctx_extension,
+        "ipc": ipc_service.register_ipc_extension,
+        "mh": messaging_service.register_mh_extension,
+        "rag": messaging_service.register_rag_extension,
+        "rpp": messaging_service.register_rpp_extension,
+    }
 
     # Register the extensions.
     try:
+        # Import all the extensions first, so that their classes can be
+        # indexed in a single pass over the extension interfaces.
+        for ext in extensions:
+            try:
+                import_module(ext.path)
+            except ModuleNotFoundError as e:
+                logging_gateway.error(f"Could not import module ({ext.path}).")
+                raise ConfigurationError(
+                    f"Could not import module ({ext.path})."
+                ) from e
+        extension_classes = _index_extension_classes()
+
+        # FW extension setups are independent of each other, so the extensions
+        # are collected here and set up concurrently once all are registered.
+        # The setup coroutines are only created then, so that none are left
+        # unawaited if a later extension fails to register.
+        fw_extensions = []
         for ext in extensions:
-            registered = False
-
-            import_module(name=ext.path)
-
-            if ext.type == "ct":
-                ct_ext_class = [
-                    x for x in ICTExtension.__subclasses__() if x.__module__ == ext.path
-                ][0]
-                ct_ext = ct_ext_class()
-                if platform_service.extension_supported(ct_ext):
-                    messaging_service.register_ct_extension(ct_ext)
-                    registered = True
-            elif ext.type == "ctx":
-                ctx_ext_class = [
-                    x
-                    for x in ICTXExtension.__subclasses__()
-                    if x.__module__ == ext.path
-                ][0]
-                ctx_ext = ctx_ext_class()
-                if platform_service.extension_supported(ctx_ext):
-                    messaging_service.register_ctx_extension(ctx_ext)
-                    registered = True
-            elif ext.type == "fw":
-                fw_ext_class = [
-                    x for x in IFWExtension.__subclasses__() if x.__module__ == ext.path
-                ][0]
-                fw_ext = fw_ext_class()
-                if platform_service.extension_supported(fw_ext):
-                    await fw_ext.setup()
-                    registered = True
-            elif ext.type == "ipc":
-                ipc_ext_class = [
-                    x
-                    for x in IIPCExtension.__subclasses__()
-                    if x.__module__ == ext.path
-                ][0]
-                ipc_ext = ipc_ext_class()
-                if platform_service.extension_supported(ipc_ext):
-                    ipc_service.register_ipc_extension(ipc_ext)
-                    registered = True
-            elif ext.type == "mh":
-                mh_ext_class = [
-                    x for x in IMHExtension.__subclasses__() if x.__module__ == ext.path
-                ][0]
-                mh_ext = mh_ext_class()
-                if platform_service.extension_supported(mh_ext):
-                    messaging_service.register_mh_extension(mh_ext)
-                    registered = True
-            elif ext.type == "rag":
-                rag_ext_class = [
-                    x
-                    for x in IRAGExtension.__subclasses__()
-                    if x.__module__ == ext.path
-                ][0]
-                rag_ext = rag_ext_class()
-                if platform_service.extension_supported(rag_ext):
-                    messaging_service.register_rag_extension(rag_ext)
-                    registered = True
-            elif ext.type == "rpp":
-                rpp_ext_class = [
-                    x
-                    for x in IRPPExtension.__subclasses__()
-                    if x.__module__ == ext.path
-                ][0]
-                rpp_ext = rpp_ext_class()
-                if platform_service.extension_supported(rpp_ext):
-                    messaging_service.register_rpp_extension(rpp_ext)
-                    registered = True
-            if registered:
-                logging_gateway.debug(
-                    f"Registered {ext.type.upper()} extension: {ext.path}"
+            # Skip unknown extension types.
+            if ext.type not in _EXTENSION_INTERFACES:
+                logging_gateway.warning(
+                    f"Unknown extension type ({ext.type}): {ext.path}"
                 )
-    except (IndexError, TypeError) as e:
+                continue
+
+            ext_instance = extension_classes[(ext.type, ext.path)]()
+            if not platform_service.extension_supported(ext_instance):
+                continue
+
+            # FW extensions are set up rather than registered with a service.
+            if ext.type == "fw":
+                fw_extensions.append(ext_instance)
+            else:
+                ext_registrars[ext.type](ext_instance)
+
+            logging_gateway.debug(
+                f"Registered {ext.type.upper()} extension: {ext.path}"
+            )
+
+        await asyncio.gather(*(x.setup() for x in fw_extensions))
+    except (KeyError, TypeError) as e:
         logging_gateway.error(e.__traceback__)
-        sys.exit(1)
+        raise ConfigurationError("Extension registration failed.") from e
 
     # Register blueprints after extensions have been loaded.
     # This allows extensions to hack the api.
     app.register_blueprint(api, url_prefix="/api")
 
     try:
-        await asyncio.gather(*tasks)
+        # Run the assistants for the enabled platforms. Each client is run
+        # through a wrapper that logs its failure, so that one failing platform
+        # does not cancel the others.
+        async with asyncio.TaskGroup() as tg:
+            for run_client in client_runners:
+                tg.create_task(_run_platform_client(run_client, logging_gateway))
     except asyncio.exceptions.CancelledError:
-        if di.container.whatsapp_client is not None:
-            await di.container.whatsapp_client.close()
+        whatsapp_client = di.container.whatsapp_client
+        if whatsapp_client is not None:
+            await whatsapp_client.close()
+
+
+async def _run_platform_client(
+    run_client: Callable[[], Awaitable[None]],
+    logging_gateway: ILoggingGateway,
+) -> None:
+    """Run a platform client, logging any failure instead of raising it."""
+    try:
+        await run_client()
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        logging_gateway.error(f"Platform client failed ({run_client.__name__}): {e!r}")
 
 
 async def run_telnet_client() -> None:
@@ -215,7 +239,7 @@ async def run_telnet_client() -> None:
     telnet_client: ITelnetClient
     async with di.container.telnet_client as telnet_client:
         try:
-            await asyncio.create_task(telnet_client.start_server())
+            await telnet_client.start_server()
         except asyncio.exceptions.CancelledError:
             logging_gateway.debug("Telnet client shutting down.")
 
@@ -223,7 +247,8 @@ async def run_telnet_client() -> None:
 async def run_matrix_client() -> None:
     """Run assistant for the Matrix platform."""
 
-    # Get logging gateway.
+    # Resolve the configuration and logging gateway once.
+    config = di.container.config
     logging_gateway = di.container.logging_gateway
 
     # Initialise matrix client.
@@ -236,7 +261,7 @@ async def run_matrix_client() -> None:
 
             # Set profile name if it's not already set.
             profile = await matrix_client.get_profile()
-            assistant_display_name = di.container.config.matrix.assistant.name
+            assistant_display_name = config.matrix.assistant.name
             if (
                 assistant_display_name is not None
                 and profile.displayname != assistant_display_name
@@ -250,14 +275,12 @@ async def run_matrix_client() -> None:
         try:
             # Start process loop.
             await asyncio.gather(
-                asyncio.create_task(wait_on_first_sync()),
-                asyncio.create_task(
-                    matrix_client.sync_forever(
-                        since=matrix_client.sync_token,
-                        timeout=100,
-                        full_state=True,
-                        set_presence="online",
-                    )
+                wait_on_first_sync(),
+                matrix_client.sync_forever(
+                    since=matrix_client.sync_token,
+                    timeout=100,
+                    full_state=True,
+                    set_presence="online",
                 ),
             )
         except asyncio.exceptions.CancelledError:
@@ -266,4 +289,4 @@ async def run_matrix_client() -> None:
 
 async def run_whatsapp_client() -> None:
     """Run assistant for the whatsapp platform."""
-    await asyncio.gather(asyncio.create_task(di.container.whatsapp_client.init()))
+    await di.container.whatsapp_client.init()
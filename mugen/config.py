@@ -10,7 +10,7 @@ from quart import Quart
 class Config:  # pylint: disable=too-few-public-methods
     """Base configuration class."""
 
-    BASEDIR: str = os.path.abspath(os.path.dirname(__file__) + "/../")
+    BASEDIR: str = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 
     # Clear debug flag.
     DEBUG: bool = False
@@ -1,12 +1,14 @@
 """Implements API endpoints."""
 
 import asyncio
+import hmac
 import json
 
 from quart import abort, current_app, request
 
 from mugen.core import di
 from mugen.core.api import api
+from mugen.core.contract.service.ipc import IIPCService
 from mugen_util.decorator import (
     matrix_platform_required,
     whatsapp_platform_required,
@@ -15,34 +17,67 @@ from mugen_util.decorator import (
 )
 
 
-@api.get("/matrix")
-@matrix_platform_required(config=di.container.config)
-async def matrix_index(ipc_service=di.container.ipc_service):
-    """Matrix index endpoint."""
+class _IPCResponseQueue:
+    """A single-use channel for the response to an IPC request.
+
+    IPC extensions respond by putting an item on the payload's response queue.
+    The item is held in a future rather than a queue, and only the first item
+    put is kept, so that several extensions can handle the same command.
+    """
+
+    __slots__ = ("_future",)
+
+    def __init__(self) -> None:
+        self._future = asyncio.get_running_loop().create_future()
+
+    async def put(self, item: dict) -> None:
+        """Put the response to the IPC request."""
+        self.put_nowait(item)
 
-    # Queue allowing IPC queue consumer
-    # to send back a response.
-    response_queue = asyncio.Queue()
+    def put_nowait(self, item: dict) -> None:
+        """Put the response to the IPC request without blocking."""
+        # Later responses are ignored.
+        if not self._future.done():
+            self._future.set_result(item)
+
+    async def get(self) -> dict:
+        """Wait for the response to the IPC request."""
+        return await self._future
+
+
+async def _ipc_dispatch(
+    ipc_service: IIPCService,
+    platform: str,
+    command: str,
+    data: dict | None = None,
+) -> dict:
+    """Send an IPC request and wait for its response."""
+    # Queue allowing IPC queue consumer to send back a response.
+    response_queue = _IPCResponseQueue()
+
+    payload = {
+        "response_queue": response_queue,
+        "command": command,
+    }
+    if data is not None:
+        payload["data"] = data
 
     try:
-        await ipc_service.handle_ipc_request(
-            "matrix",
-            {
-                "response_queue": response_queue,
-                "command": "matrix_get_status",
-            },
-        )
+        await ipc_service.handle_ipc_request(platform, payload)
     except AttributeError:
         current_app.logger.error("Invalid IPC service.")
         abort(500)
 
-    # Ensure other tasks can run,
-    # otherwise no response will be sent back.
-    while response_queue.empty():
-        await asyncio.sleep(0)
+    # Wait for the response from the response queue.
+    return await response_queue.get()
+
 
-    # Get the response from the response queue.
-    response = await response_queue.get()
+@api.get("/matrix")
+@matrix_platform_required(config=di.container.config)
+async def matrix_index(ipc_service=di.container.ipc_service):
+    """Matrix index endpoint."""
+
+    response = await _ipc_dispatch(ipc_service, "matrix", "matrix_get_status")
     return {"status": response["response"]}
 
 
@@ -53,38 +88,16 @@ async def matrix_webhook(ipc_service=di.container.ipc_service):
     # Get request data.
     data = await request.get_json()
 
-    try:
-        if "command" not in data.keys() or data["command"] == "":
-            current_app.logger.error("Invalid JSON data supplied.")
-            abort(400)
-    except AttributeError:
+    if not isinstance(data, dict):
         current_app.logger.error("JSON data empty.")
         abort(500)
 
-    # Queue allowing IPC queue consumer to send back a response.
-    response_queue = asyncio.Queue()
-
-    try:
-        await ipc_service.handle_ipc_request(
-            "matrix",
-            {
-                "response_queue": response_queue,
-                "command": data["command"],
-                "data": data,
-            },
-        )
-    except AttributeError:
-        current_app.logger.error("Invalid IPC service.")
-        abort(500)
-
-    # Ensure other tasks can run,
-    # otherwise no response will be sent back.
-    while response_queue.empty():
-        await asyncio.sleep(0)
+    command = data.get("command")
+    if not command:
+        current_app.logger.error("Invalid JSON data supplied.")
+        abort(400)
 
-    # Get the response from the response queue.
-    response = await response_queue.get()
-    return response
+    return await _ipc_dispatch(ipc_service, "matrix", command, data)
 
 
 @api.get("/whatsapp")
@@ -92,28 +105,7 @@ async def matrix_webhook(ipc_service=di.container.ipc_service):
 async def whatsapp_index(ipc_service=di.container.ipc_service):
     """Whatsapp index endpoint."""
 
-    # Queue allowing IPC queue consumer to send back a response.
-    response_queue = asyncio.Queue()
-
-    try:
-        await ipc_service.handle_ipc_request(
-            "whatsapp",
-            {
-                "response_queue": response_queue,
-                "command": "whatsapp_get_status",
-            },
-        )
-    except AttributeError:
-        current_app.logger.error("Invalid IPC service.")
-        abort(500)
-
-    # Ensure other tasks can run,
-    # otherwise no response will be sent back.
-    while response_queue.empty():
-        await asyncio.sleep(0)
-
-    # Get the response from the response queue.
-    response = await response_queue.get()
+    response = await _ipc_dispatch(ipc_service, "whatsapp", "whatsapp_get_status")
     return {"status": response["response"]}
 
 
@@ -122,31 +114,38 @@ async def whatsapp_index(ipc_service=di.container.ipc_service):
 @whatsapp_server_ip_allow_list_required(config=di.container.config)
 async def whatsapp_wacapi_subscription(config=di.container.config):
     """Whatsapp Cloud API verification."""
+    # Read the query parameters once.
+    args = request.args
+    verify_token = args.get("hub.verify_token")
+    challenge = args.get("hub.challenge")
 
-    if request.args.get("hub.mode") != "subscribe":
+    if args.get("hub.mode") != "subscribe":
         current_app.logger.error("hub.mode incorrect.")
         abort(400)
 
-    if request.args.get("hub.verify_token") in [None, ""]:
+    if not isinstance(verify_token, str) or verify_token == "":
         current_app.logger.error("hub.verify_token not supplied or is empty.")
         abort(400)
 
     try:
-        if (
-            request.args.get("hub.verify_token")
-            != config.whatsapp.webhook.verification_token
-        ):
-            current_app.logger.error("Incorrect verification token.")
-            abort(400)
+        verification_token = config.whatsapp.webhook.verification_token
     except AttributeError:
+        verification_token = None
+
+    if not isinstance(verification_token, str):
         current_app.logger.error("Could not get verification token.")
         abort(500)
 
-    if request.args.get("hub.challenge") in [None, ""]:
+    # Compare the tokens in constant time.
+    if not hmac.compare_digest(verify_token.encode(), verification_token.encode()):
+        current_app.logger.error("Incorrect verification token.")
+        abort(400)
+
+    if challenge in [None, ""]:
         current_app.logger.error("hub.challenge not supplied or is empty.")
         abort(400)
 
-    return request.args.get("hub.challenge")
+    return challenge
 
 
 @api.post("/whatsapp/wacapi/webhook")
@@ -167,30 +166,9 @@ async def whatsapp_wacapi_event(ipc_service=di.container.ipc_service):
         current_app.logger.error("JSON data could not be decoded.")
         abort(500)
 
-    # Queue allowing IPC queue consumer to send back a response.
-    response_queue = asyncio.Queue()
-
-    try:
-        await ipc_service.handle_ipc_request(
-            "whatsapp",
-            {
-                "response_queue": response_queue,
-                "command": "whatsapp_wacapi_event",
-                "data": json_data,
-            },
-        )
-    except AttributeError:
-        current_app.logger.error("Invalid IPC service.")
-        abort(500)
-
-    # Ensure other tasks can run,
-    # otherwise no response will be sent back.
-    while response_queue.empty():
-        await asyncio.sleep(0)
-
-    # Get the response from the response queue.
-    response = await response_queue.get()
-    return response
+    return await _ipc_dispatch(
+        ipc_service, "whatsapp", "whatsapp_wacapi_event", json_data
+    )
 
 
 @api.put("/whatsapp/webhook")
@@ -200,35 +178,13 @@ async def whatsapp_webhook(ipc_service=di.container.ipc_service):
     # Get request data.
     data = await request.get_json()
 
-    try:
-        if "command" not in data.keys() or data["command"] == "":
-            current_app.logger.error("Invalid JSON data supplied.")
-            abort(400)
-    except AttributeError:
+    if not isinstance(data, dict):
         current_app.logger.error("JSON data empty.")
         abort(500)
 
-    # Queue allowing IPC queue consumer to send back a response.
-    response_queue = asyncio.Queue()
-
-    try:
-        await ipc_service.handle_ipc_request(
-            "whatsapp",
-            {
-                "response_queue": response_queue,
-                "command": data["command"],
-                "data": data,
-            },
-        )
-    except AttributeError:
-        current_app.logger.error("Invalid IPC service.")
-        abort(500)
-
-    # Ensure other tasks can run,
-    # otherwise no response will be sent back.
-    while response_queue.empty():
-        await asyncio.sleep(0)
+    command = data.get("command")
+    if not command:
+        current_app.logger.error("Invalid JSON data supplied.")
+        abort(400)
 
-    # Get the response from the response queue.
-    response = await response_queue.get()
-    return response
+    return await _ipc_dispatch(ipc_service, "whatsapp", command, data)
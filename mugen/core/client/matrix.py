@@ -3,6 +3,7 @@
 __all__ = ["DefaultMatrixClient"]
 
 import asyncio
+import contextlib
 import os
 import pickle
 import sys
@@ -10,6 +11,7 @@ import traceback
 from types import SimpleNamespace
 from typing import Coroutine
 
+from cachetools import LRUCache
 from nio import (
     InviteAliasEvent,
     InviteMemberEvent,
@@ -45,12 +47,31 @@ from mugen.core.contract.service.ipc import IIPCService
 from mugen.core.contract.service.messaging import IMessagingService
 from mugen.core.contract.service.user import IUserService
 
+# Map encrypted media events to the message types handled by MH extensions.
+_MEDIA_MESSAGE_TYPES: dict[type, str] = {
+    RoomEncryptedAudio: "audio",
+    RoomEncryptedFile: "file",
+    RoomEncryptedImage: "image",
+    RoomEncryptedVideo: "video",
+}
+
+
+def _config_frozenset(config: SimpleNamespace, path: str) -> frozenset:
+    """Build a frozenset from an optional list in the configuration."""
+    value = config
+    for name in path.split("."):
+        value = getattr(value, name, None)
+    return frozenset(value or ())
+
 
 class DefaultMatrixClient(  # pylint: disable=too-many-instance-attributes
     IMatrixClient
 ):
     """A custom implementation of IMatrixClient."""
 
+    # Maximum number of direct chat rooms kept in the cache.
+    _direct_rooms_cache_maxsize: int = 1024
+
     _flags_key: str = "m.agent_flags"
 
     _ipc_callback: Coroutine
@@ -84,6 +105,36 @@ class DefaultMatrixClient(  # pylint: disable=too-many-instance-attributes
         self._messaging_service = messaging_service
         self._user_service = user_service
 
+        # Sets of the configured domains and beta users for constant time
+        # membership tests when processing invites. Unset lists are empty.
+        self._allowed_domains = _config_frozenset(
+            self._config, "matrix.domains.allowed"
+        )
+        self._denied_domains = _config_frozenset(self._config, "matrix.domains.denied")
+        self._beta_users = _config_frozenset(self._config, "matrix.beta.users")
+
+        # The known devices list is only modified by this client, so it is
+        # loaded from storage once and kept in memory.
+        self._known_devices: dict[str, list[str]] | None = None
+
+        # The latest sync token can be kept in memory and written to storage at
+        # regular intervals, rather than on every sync response. Tokens not yet
+        # written are lost if the process is killed, and the events since the
+        # last written token are then processed again on restart. An interval
+        # of 0 (the default) writes every token.
+        try:
+            self._sync_token_flush_interval = float(
+                self._config.matrix.storage.sync.flush_interval
+            )
+        except (AttributeError, TypeError, ValueError):
+            self._sync_token_flush_interval = 0
+        self._pending_sync_token: str | None = None
+        self._sync_token_flusher: asyncio.Task | None = None
+
+        # Rooms known to be flagged as direct chats. Only positive results are
+        # cached, since a room can be flagged after its first message arrives.
+        self._direct_rooms = LRUCache(maxsize=self._direct_rooms_cache_maxsize)
+
         ## Callbacks
         # Invite Room Events.
         self.add_event_callback(self._cb_invite_alias_event, InviteAliasEvent)
@@ -141,11 +192,25 @@ class DefaultMatrixClient(  # pylint: disable=too-many-instance-attributes
         self.device_id = self._keyval_storage_gateway.get("client_device_id")
         self.user_id = self._keyval_storage_gateway.get("client_user_id")
         self.load_store()
+
+        # Start writing sync tokens to storage at regular intervals.
+        if self._sync_token_flush_interval > 0:
+            self._sync_token_flusher = asyncio.create_task(
+                self._flush_sync_token_periodically()
+            )
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         """Finalisation."""
         self._logging_gateway.debug("DefaultMatrixClient.__aexit__")
+        # Stop the periodic writes and persist the latest sync token.
+        if self._sync_token_flusher is not None:
+            self._sync_token_flusher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._sync_token_flusher
+            self._sync_token_flusher = None
+        self._flush_sync_token()
+
         try:
             await self.client_session.close()
         except AttributeError:
@@ -154,61 +219,67 @@ class DefaultMatrixClient(  # pylint: disable=too-many-instance-attributes
     @property
     def sync_token(self) -> str:
         """Get the key to access the sync key from persistent storage."""
+        if self._pending_sync_token is not None:
+            return self._pending_sync_token
         return self._keyval_storage_gateway.get(self._sync_key)
 
     def cleanup_known_user_devices_list(self) -> None:
         """Clean up known user devices list."""
         self._logging_gateway.debug("Cleaning up known user devices.")
-        if self._keyval_storage_gateway.has_key(self._known_devices_list_key):
-            known_devices = pickle.loads(
-                self._keyval_storage_gateway.get(self._known_devices_list_key, False)
-            )
-            for user_id in known_devices.keys():
-                active_devices = [
-                    x.device_id for x in self.device_store.active_user_devices(user_id)
-                ]
-                self._logging_gateway.debug(f"Active devices: {active_devices}")
+        known_devices = self._load_known_devices()
+        changed = False
+        for user_id, device_ids in known_devices.items():
+            active_devices = [
+                x.device_id for x in self.device_store.active_user_devices(user_id)
+            ]
+            self._logging_gateway.debug(f"Active devices: {active_devices}")
+            if active_devices != device_ids:
                 known_devices[user_id] = active_devices
+                changed = True
 
-            # Persist changes.
-            self._keyval_storage_gateway.put(
-                self._known_devices_list_key, pickle.dumps(known_devices)
-            )
+        # Persist changes.
+        if changed:
+            self._save_known_devices()
 
     def trust_known_user_devices(self) -> None:
         """Trust all known user devices."""
         self._logging_gateway.debug("Trusting all known user devices.")
-        if self._keyval_storage_gateway.has_key(self._known_devices_list_key):
-            known_devices = pickle.loads(
-                self._keyval_storage_gateway.get(self._known_devices_list_key, False)
-            )
-            for user_id in known_devices.keys():
-                self._logging_gateway.debug(f"User: {user_id}")
-                for device_id, olm_device in self.device_store[user_id].items():
-                    if device_id in known_devices[user_id]:
-                        # Verify the device.
-                        self._logging_gateway.debug(f"Trusting {device_id}.")
-                        self.verify_device(olm_device)
+        known_devices = self._load_known_devices()
+
+        # Collect the known devices that still need to be trusted.
+        # Devices that are already verified are skipped to avoid
+        # needless writes to the olm store.
+        unverified_devices = []
+        for user_id, device_ids in known_devices.items():
+            self._logging_gateway.debug(f"User: {user_id}")
+            # Use a set for constant time membership tests.
+            known_user_devices = set(device_ids)
+            unverified_devices += [
+                olm_device
+                for device_id, olm_device in self.device_store[user_id].items()
+                if device_id in known_user_devices and not olm_device.verified
+            ]
+
+        for olm_device in unverified_devices:
+            # Verify the device.
+            self._logging_gateway.debug(f"Trusting {olm_device.device_id}.")
+            self.verify_device(olm_device)
 
     def verify_user_devices(self, user_id: str) -> None:
         """Verify all of a user's devices."""
         self._logging_gateway.debug(f"Verifying all user devices ({user_id}).")
+        # Load the known devices list once for all the user's devices.
+        known_devices = self._load_known_devices()
+        changed = False
+
         # This has to be revised when we figure out a trust mechanism.
         # A solution might be to require users to visit sys admin to perform SAS
         # verification whenever using a new device.
         for device_id, olm_device in self.device_store[user_id].items():
             self._logging_gateway.debug(f"Found {device_id}.")
-            known_devices = {}
-            # Load the known devices list if it already exists.
-            if self._keyval_storage_gateway.has_key(self._known_devices_list_key):
-                known_devices = pickle.loads(
-                    self._keyval_storage_gateway.get(
-                        self._known_devices_list_key, False
-                    )
-                )
 
             # If the list (new or loaded) does not contain an entry for the user.
-            if user_id not in known_devices.keys():
+            if user_id not in known_devices:
                 # Add an entry for the user.
                 known_devices[user_id] = []
 
@@ -216,15 +287,15 @@ class DefaultMatrixClient(  # pylint: disable=too-many-instance-attributes
             if device_id not in known_devices[user_id]:
                 # Add the device id to the list of known devices for the user.
                 known_devices[user_id].append(device_id)
+                changed = True
 
                 # Verify the device.
                 self._logging_gateway.debug(f"Verifying {device_id}.")
                 self.verify_device(olm_device)
 
-                # Persist changes to the known devices list.
-                self._keyval_storage_gateway.put(
-                    self._known_devices_list_key, pickle.dumps(known_devices)
-                )
+        # Persist changes to the known devices list.
+        if changed:
+            self._save_known_devices()
 
     ## Callbacks.
     # Events
@@ -247,10 +318,11 @@ class DefaultMatrixClient(  # pylint: disable=too-many-instance-attributes
         # Only process invites from allowed domains.
         # Federated servers need to be in the allowed domains list for their users
         # to initiate conversations with the assistant.
-        allowed_domains: list = self._config.matrix.domains.allowed
-        denied_domains: list = self._config.matrix.domains.denied
-        sender_domain: str = event.sender.split(":")[1]
-        if sender_domain not in allowed_domains or sender_domain in denied_domains:
+        sender_domain: str = event.sender.split(":", 2)[1]
+        if (
+            sender_domain not in self._allowed_domains
+            or sender_domain in self._denied_domains
+        ):
             await self.room_leave(room.room_id)
             self._logging_gateway.warning(
                 "InviteMemberEvent: Rejected invitation. Reason: Domain"
@@ -261,8 +333,7 @@ class DefaultMatrixClient(  # pylint: disable=too-many-instance-attributes
         # If the assistant is in limited-beta mode, only process invites from the
         # list of selected beta users.
         if self._config.mugen.beta.active:
-            beta_users: list = self._config.matrix.beta.users
-            if event.sender not in beta_users:
+            if event.sender not in self._beta_users:
                 await self.room_leave(room.room_id)
                 self._logging_gateway.warning(
                     "InviteMemberEvent: Rejected invitation. Reason:"
@@ -350,70 +421,17 @@ class DefaultMatrixClient(  # pylint: disable=too-many-instance-attributes
             return
 
         hits: int = 0
+        message_type = _MEDIA_MESSAGE_TYPES.get(type(message))
         message_handlers = self._messaging_service.mh_extensions
         for handler in message_handlers:
             if handler.platforms == [] or "matrix" in handler.platforms:
-                # Handle audio messages.
-                if (
-                    isinstance(message, RoomEncryptedAudio)
-                    and "audio" in handler.message_types
-                ):
-                    await asyncio.gather(
-                        asyncio.create_task(
-                            handler.handle_message(
-                                room_id=room.room_id,
-                                sender=message.sender,
-                                message=message,
-                            )
-                        )
-                    )
-                    hits += 1
-
-                # Handle file messages.
-                if (
-                    isinstance(message, RoomEncryptedFile)
-                    and "file" in handler.message_types
-                ):
-                    await asyncio.gather(
-                        asyncio.create_task(
-                            handler.handle_message(
-                                room_id=room.room_id,
-                                sender=message.sender,
-                                message=message,
-                            )
-                        )
-                    )
-                    hits += 1
-
-                # Handle image messages.
-                if (
-                    isinstance(message, RoomEncryptedImage)
-                    and "image" in handler.message_types
-                ):
-                    await asyncio.gather(
-                        asyncio.create_task(
-                            handler.handle_message(
-                                room_id=room.room_id,
-                                sender=message.sender,
-                                message=message,
-                            )
-                        )
-                    )
-                    hits += 1
-
-                # Handle video messages.
-                if (
-                    isinstance(message, RoomEncryptedVideo)
-                    and "video" in handler.message_types
-                ):
-                    await asyncio.gather(
-                        asyncio.create_task(
-                            handler.handle_message(
-                                room_id=room.room_id,
-                                sender=message.sender,
-                                message=message,
-                            )
-                        )
+                # Pass audio, file, image, and video messages to the handlers
+                # that support their type.
+                if message_type is not None and message_type in handler.message_types:
+                    await handler.handle_message(
+                        room_id=room.room_id,
+                        sender=message.sender,
+                        message=message,
                     )
                     hits += 1
 
@@ -445,9 +463,12 @@ class DefaultMatrixClient(  # pylint: disable=too-many-instance-attributes
             await self._send_text_message(room_id=room.room_id, body=response)
 
     async def _cb_room_member_event(
-        self, _room: MatrixRoom, _event: RoomMemberEvent
+        self, room: MatrixRoom, event: RoomMemberEvent
     ) -> None:
         """Handle RoomMemberEvents."""
+        # Forget cached direct chat flags for rooms the assistant has left.
+        if event.state_key == self.user_id and event.membership != "join":
+            self._direct_rooms.pop(room.room_id, None)
 
     async def _cb_tag_event(self, _event: TagEvent) -> None:
         """Handle TagEvents."""
@@ -455,16 +476,62 @@ class DefaultMatrixClient(  # pylint: disable=too-many-instance-attributes
     # Responses
     async def _cb_sync_response(self, resp: SyncResponse):
         """Handle SyncResponses."""
-        self._keyval_storage_gateway.put(self._sync_key, resp.next_batch)
+        self._pending_sync_token = resp.next_batch
+        if self._sync_token_flush_interval <= 0:
+            self._flush_sync_token()
 
     ## Utilities.
+    def _flush_sync_token(self) -> None:
+        """Persist the latest sync token if it has not been saved yet."""
+        if self._pending_sync_token is not None:
+            self._keyval_storage_gateway.put(self._sync_key, self._pending_sync_token)
+            self._pending_sync_token = None
+
+    async def _flush_sync_token_periodically(self) -> None:
+        """Persist the latest sync token at regular intervals."""
+        while True:
+            await asyncio.sleep(self._sync_token_flush_interval)
+            # Keep flushing after a failed write. The token stays pending, so
+            # it is written again on the next attempt.
+            try:
+                self._flush_sync_token()
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                self._logging_gateway.error(f"Could not save sync token: {e!r}")
+
+    def _load_known_devices(self) -> dict[str, list[str]]:
+        """Get the known devices list, loading it from storage on first use."""
+        if self._known_devices is None:
+            known_devices = self._keyval_storage_gateway.get(
+                self._known_devices_list_key, False
+            )
+            self._known_devices = (
+                {} if known_devices is None else pickle.loads(known_devices)
+            )
+        return self._known_devices
+
+    def _save_known_devices(self) -> None:
+        """Persist the cached known devices list."""
+        self._keyval_storage_gateway.put(
+            self._known_devices_list_key,
+            pickle.dumps(self._known_devices, protocol=pickle.HIGHEST_PROTOCOL),
+        )
+
     async def _is_direct_message(self, room_id: str) -> bool:
         """Indicate if the given room was flagged as a 1:1 chat."""
+        if room_id in self._direct_rooms:
+            return True
+
         room_state = await self.room_get_state(room_id)
-        flags: list[dict[str, dict[str, int]]] = [
-            x for x in room_state.events if x["type"] == self._flags_key
-        ]
-        return len(flags) > 0 and "m.direct" in flags[0].get("content").keys()
+
+        # Stop at the first flags event.
+        flags: dict[str, dict[str, int]] | None = next(
+            (x for x in room_state.events if x["type"] == self._flags_key),
+            None,
+        )
+        is_direct = flags is not None and "m.direct" in flags["content"]
+        if is_direct:
+            self._direct_rooms[room_id] = True
+        return is_direct
 
     async def _send_text_message(self, room_id: str, body: str) -> None:
         try:
@@ -78,20 +78,7 @@ class DefaultWhatsAppClient(IWhatsAppClient):
         recipient: str,
         reply_to: str = None,
     ) -> str | None:
-        data = {
-            "messaging_product": "whatsapp",
-            "recipient_type": "individual",
-            "to": f"+{recipient}",
-            "type": "audio",
-            "audio": audio,
-        }
-
-        if reply_to:
-            data["context"] = {
-                "message_id": reply_to,
-            }
-
-        return await self._send_message(data=data)
+        return await self._send_typed_message("audio", audio, recipient, reply_to)
 
     async def send_contacts_message(
         self,
@@ -99,20 +86,7 @@ class DefaultWhatsAppClient(IWhatsAppClient):
         recipient: str,
         reply_to: str = None,
     ) -> str | None:
-        data = {
-            "messaging_product": "whatsapp",
-            "recipient_type": "individual",
-            "to": f"+{recipient}",
-            "type": "contacts",
-            "contacts": contacts,
-        }
-
-        if reply_to:
-            data["context"] = {
-                "message_id": reply_to,
-            }
-
-        return await self._send_message(data=data)
+        return await self._send_typed_message("contacts", contacts, recipient, reply_to)
 
     async def send_document_message(
         self,
@@ -120,20 +94,7 @@ class DefaultWhatsAppClient(IWhatsAppClient):
         recipient: str,
         reply_to: str = None,
     ) -> str | None:
-        data = {
-            "messaging_product": "whatsapp",
-            "recipient_type": "individual",
-            "to": f"+{recipient}",
-            "type": "document",
-            "document": document,
-        }
-
-        if reply_to:
-            data["context"] = {
-                "message_id": reply_to,
-            }
-
-        return await self._send_message(data=data)
+        return await self._send_typed_message("document", document, recipient, reply_to)
 
     async def send_image_message(
         self,
@@ -141,20 +102,7 @@ class DefaultWhatsAppClient(IWhatsAppClient):
         recipient: str,
         reply_to: str = None,
     ) -> str | None:
-        data = {
-            "messaging_product": "whatsapp",
-            "recipient_type": "individual",
-            "to": f"+{recipient}",
-            "type": "image",
-            "image": image,
-        }
-
-        if reply_to:
-            data["context"] = {
-                "message_id": reply_to,
-            }
-
-        return await self._send_message(data=data)
+        return await self._send_typed_message("image", image, recipient, reply_to)
 
     async def send_interactive_message(
         self,
@@ -162,20 +110,9 @@ class DefaultWhatsAppClient(IWhatsAppClient):
         recipient: str,
         reply_to: str = None,
     ) -> str | None:
-        data = {
-            "messaging_product": "whatsapp",
-            "recipient_type": "individual",
-            "to": f"+{recipient}",
-            "type": "interactive",
-            "interactive": interactive,
-        }
-
-        if reply_to:
-            data["context"] = {
-                "message_id": reply_to,
-            }
-
-        return await self._send_message(data=data)
+        return await self._send_typed_message(
+            "interactive", interactive, recipient, reply_to
+        )
 
     async def send_location_message(
         self,
@@ -183,31 +120,10 @@ class DefaultWhatsAppClient(IWhatsAppClient):
         recipient: str,
         reply_to: str = None,
     ) -> str | None:
-        data = {
-            "messaging_product": "whatsapp",
-            "recipient_type": "individual",
-            "to": f"+{recipient}",
-            "type": "location",
-            "location": location,
-        }
-
-        if reply_to:
-            data["context"] = {
-                "message_id": reply_to,
-            }
-
-        return await self._send_message(data=data)
+        return await self._send_typed_message("location", location, recipient, reply_to)
 
     async def send_reaction_message(self, reaction: dict, recipient: str) -> None:
-        data = {
-            "messaging_product": "whatsapp",
-            "recipient_type": "individual",
-            "to": f"+{recipient}",
-            "type": "reaction",
-            "reaction": reaction,
-        }
-
-        return await self._send_message(data=data)
+        return await self._send_typed_message("reaction", reaction, recipient)
 
     async def send_sticker_message(
         self,
@@ -215,20 +131,7 @@ class DefaultWhatsAppClient(IWhatsAppClient):
         recipient: str,
         reply_to: str = None,
     ) -> str | None:
-        data = {
-            "messaging_product": "whatsapp",
-            "recipient_type": "individual",
-            "to": f"+{recipient}",
-            "type": "sticker",
-            "sticker": sticker,
-        }
-
-        if reply_to:
-            data["context"] = {
-                "message_id": reply_to,
-            }
-
-        return await self._send_message(data=data)
+        return await self._send_typed_message("sticker", sticker, recipient, reply_to)
 
     async def send_template_message(
         self,
@@ -236,20 +139,7 @@ class DefaultWhatsAppClient(IWhatsAppClient):
         recipient: str,
         reply_to: str = None,
     ) -> str | None:
-        data = {
-            "messaging_product": "whatsapp",
-            "recipient_type": "individual",
-            "to": f"+{recipient}",
-            "type": "template",
-            "template": template,
-        }
-
-        if reply_to:
-            data["context"] = {
-                "message_id": reply_to,
-            }
-
-        return await self._send_message(data=data)
+        return await self._send_typed_message("template", template, recipient, reply_to)
 
     async def send_text_message(
         self,
@@ -257,23 +147,15 @@ class DefaultWhatsAppClient(IWhatsAppClient):
         recipient: str,
         reply_to: str = None,
     ) -> str | None:
-        data = {
-            "messaging_product": "whatsapp",
-            "recipient_type": "individual",
-            "to": f"+{recipient}",
-            "type": "text",
-            "text": {
+        return await self._send_typed_message(
+            "text",
+            {
                 "preview_url": True,
                 "body": message,
             },
-        }
-
-        if reply_to:
-            data["context"] = {
-                "message_id": reply_to,
-            }
-
-        return await self._send_message(data=data)
+            recipient,
+            reply_to,
+        )
 
     async def send_video_message(
         self,
@@ -281,20 +163,7 @@ class DefaultWhatsAppClient(IWhatsAppClient):
         recipient: str,
         reply_to: str = None,
     ) -> str | None:
-        data = {
-            "messaging_product": "whatsapp",
-            "recipient_type": "individual",
-            "to": f"+{recipient}",
-            "type": "video",
-            "video": video,
-        }
-
-        if reply_to:
-            data["context"] = {
-                "message_id": reply_to,
-            }
-
-        return await self._send_message(data=data)
+        return await self._send_typed_message("video", video, recipient, reply_to)
 
     async def upload_media(
         self,
@@ -306,7 +175,8 @@ class DefaultWhatsAppClient(IWhatsAppClient):
         files.add_field("type", file_type)
 
         if isinstance(file_path, BytesIO):
-            files.add_field("file", file_path.getvalue(), content_type=file_type)
+            # Send a view of the buffer rather than a copy of its contents.
+            files.add_field("file", file_path.getbuffer(), content_type=file_type)
             return await self._call_api(self._api_media_path, files=files)
 
         with open(file_path, "rb") as file:
@@ -365,3 +235,26 @@ class DefaultWhatsAppClient(IWhatsAppClient):
             content_type="application/json",
             data=data,
         )
+
+    async def _send_typed_message(
+        self,
+        message_type: str,
+        content: dict,
+        recipient: str,
+        reply_to: str = None,
+    ) -> str | None:
+        """Build and send a message of the given type."""
+        data = {
+            "messaging_product": "whatsapp",
+            "recipient_type": "individual",
+            "to": f"+{recipient}",
+            "type": message_type,
+            message_type: content,
+        }
+
+        if reply_to:
+            data["context"] = {
+                "message_id": reply_to,
+            }
+
+        return await self._send_message(data=data)
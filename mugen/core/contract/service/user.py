@@ -20,6 +20,10 @@ class IUserService(ABC):
     def get_user_display_name(self, user_id: str) -> str:
         """Get a user's display name from the list of known users."""
 
+    @abstractmethod
+    def is_known_user(self, user_id: str) -> bool:
+        """Determine if a user is in the list of known users."""
+
     @abstractmethod
     def save_known_users_list(self, known_users: dict) -> None:
         """Save a list of known users."""
@@ -6,10 +6,9 @@ from importlib import import_module
 import logging
 import os
 import sys
+import tomllib
 from types import SimpleNamespace
 
-import tomlkit
-
 from mugen.core.contract.client.telnet import ITelnetClient
 from mugen.core.contract.client.matrix import IMatrixClient
 from mugen.core.contract.client.whatsapp import IWhatsAppClient
@@ -75,6 +74,16 @@ def _build_config_provider(
     """Build configuration provider object for DI container."""
     ns = SimpleNamespace()
     _nested_namespace_from_dict(config, ns)
+
+    # Active platforms are checked by membership throughout the application,
+    # so store them as a frozenset.
+    try:
+        if isinstance(ns.mugen.platforms, list):
+            ns.mugen.platforms = frozenset(ns.mugen.platforms)
+    except AttributeError:
+        # Platforms not configured.
+        pass
+
     try:
         injector.config = ns
     except AttributeError:
@@ -634,8 +643,8 @@ def _load_config(config_file: str) -> dict:
     basedir = os.path.realpath(rel)
     # Attempt to read TOML config file.
     try:
-        with open(os.path.join(basedir, config_file), "r", encoding="utf8") as f:
-            config = tomlkit.loads(f.read()).value
+        with open(os.path.join(basedir, config_file), "rb") as f:
+            config = tomllib.load(f)
             # Add base directory to configuration.
             config["basedir"] = basedir
             return config
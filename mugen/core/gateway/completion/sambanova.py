@@ -72,19 +72,19 @@ class SambaNovaCompletionGateway(ICompletionGateway):
 
             message: str = ""
             if len(chunks) == 1:
-                print(chunks)
+                self._logging_gateway.debug(f"SambaNova response: {chunks}")
                 json_data = json.loads(chunks[0])
-                if "type" in json_data.keys():
+                if "type" in json_data:
                     message += json_data["type"]
             else:
                 for chunk in chunks:
                     if chunk != "[DONE]":
                         json_data = json.loads(chunk)
-                        if "choices" in json_data.keys():
+                        if "choices" in json_data:
                             if json_data["choices"][0]["finish_reason"] is None:
                                 message += json_data["choices"][0]["delta"]["content"]
                         else:
-                            if "error" in json_data.keys():
+                            if "error" in json_data:
                                 message += json_data["error"]["type"]
 
             response = SimpleNamespace()
@@ -4,6 +4,7 @@ __all__ = ["QdrantKnowledgeGateway"]
 
 from types import SimpleNamespace
 
+from cachetools import TTLCache
 from qdrant_client import AsyncQdrantClient, models
 from qdrant_client.http.exceptions import ResponseHandlingException, UnexpectedResponse
 from sentence_transformers import SentenceTransformer
@@ -38,6 +39,20 @@ class QdrantKnowledgeGateway(IKnowledgeGateway):
             cache_folder=self._config.transformers.hf.home,
         )
 
+        # Repeated searches can be served from memory, skipping both the query
+        # embedding and the round trip to the database. Cached results do not
+        # reflect documents ingested until they expire, so the cache is
+        # disabled unless both its size and time to live are configured.
+        try:
+            cache_maxsize = int(self._config.qdrant.search.cache.maxsize)
+            cache_ttl = int(self._config.qdrant.search.cache.ttl)
+        except (AttributeError, TypeError, ValueError):
+            cache_maxsize = cache_ttl = 0
+
+        self._search_cache = None
+        if cache_maxsize > 0 and cache_ttl > 0:
+            self._search_cache = TTLCache(maxsize=cache_maxsize, ttl=cache_ttl)
+
     async def search(
         self,
         params: QdrantSearchVendorParams,
@@ -45,6 +60,45 @@ class QdrantKnowledgeGateway(IKnowledgeGateway):
         self._logging_gateway.debug(
             f"QdrantKnowledgeGateway: Search terms {params.search_term}"
         )
+        cache_key = None
+        if self._search_cache is not None:
+            cache_key = (
+                params.collection_name,
+                params.search_term,
+                params.count,
+                params.dataset,
+                params.date_from,
+                params.date_to,
+                tuple(params.keywords),
+                params.limit,
+                params.strategy,
+            )
+            if cache_key in self._search_cache:
+                self._logging_gateway.debug("QdrantKnowledgeGateway: Cache hit.")
+                cached = self._search_cache[cache_key]
+                # Return a new list so that callers cannot modify cached results.
+                return list(cached) if isinstance(cached, tuple) else cached
+
+            self._logging_gateway.debug("QdrantKnowledgeGateway: Cache miss.")
+
+        try:
+            result = await self._search(params)
+        except (ResponseHandlingException, UnexpectedResponse):
+            self._logging_gateway.warning(
+                "QdrantKnowledgeGateway - ResponseHandlingException"
+            )
+            return []
+
+        # Failed searches are not cached so that they are retried. Result lists
+        # are stored as tuples so that the cached copy cannot be modified.
+        if cache_key is not None:
+            self._search_cache[cache_key] = (
+                tuple(result) if isinstance(result, list) else result
+            )
+        return result
+
+    async def _search(self, params: QdrantSearchVendorParams) -> list:
+        """Run the search against the Qdrant database."""
         conditions = []
         dataset_filter = None
         # Restrict to dataset if specified.
@@ -97,40 +151,34 @@ class QdrantKnowledgeGateway(IKnowledgeGateway):
                 )
             )
         # self._logging_gateway.debug(conditions)
-        try:
-            if params.strategy == "should":
-                if params.count:
-                    return await self._client.count(
-                        collection_name=params.collection_name,
-                        count_filter=models.Filter(should=conditions),
-                        exact=True,
-                    )
-
-                return await self._client.search(
-                    collection_name=params.collection_name,
-                    query_vector=self._encoder.encode(params.search_term).tolist(),
-                    query_filter=models.Filter(
-                        must=dataset_filter,
-                        should=conditions,
-                    ),
-                    limit=params.limit,
-                )
-
+        if params.strategy == "should":
             if params.count:
                 return await self._client.count(
                     collection_name=params.collection_name,
-                    count_filter=models.Filter(must=conditions),
+                    count_filter=models.Filter(should=conditions),
                     exact=True,
                 )
 
             return await self._client.search(
                 collection_name=params.collection_name,
                 query_vector=self._encoder.encode(params.search_term).tolist(),
-                query_filter=models.Filter(must=conditions),
+                query_filter=models.Filter(
+                    must=dataset_filter,
+                    should=conditions,
+                ),
                 limit=params.limit,
             )
-        except (ResponseHandlingException, UnexpectedResponse):
-            self._logging_gateway.warning(
-                "QdrantKnowledgeGateway - ResponseHandlingException"
+
+        if params.count:
+            return await self._client.count(
+                collection_name=params.collection_name,
+                count_filter=models.Filter(must=conditions),
+                exact=True,
             )
-            return []
+
+        return await self._client.search(
+            collection_name=params.collection_name,
+            query_vector=self._encoder.encode(params.search_term).tolist(),
+            query_filter=models.Filter(must=conditions),
+            limit=params.limit,
+        )
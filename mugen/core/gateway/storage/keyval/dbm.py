@@ -54,7 +54,7 @@ class DBMKeyValStorageGateway(IKeyValStorageGateway):
         return None
 
     def has_key(self, key: str) -> bool:
-        return key.encode() in self._storage.keys()
+        return key in self._storage
 
     def close(self) -> None:
         self._storage.close()
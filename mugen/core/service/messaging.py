@@ -3,9 +3,9 @@
 __all__ = ["DefaultMessagingService"]
 
 import asyncio
-from datetime import datetime
 import json
 import pickle
+import time
 from types import SimpleNamespace
 import uuid
 
@@ -54,6 +54,31 @@ class DefaultMessagingService(IMessagingService):
         self._logging_gateway = logging_gateway
         self._user_service = user_service
 
+        # The assistant persona is static, so the system message carrying it is
+        # built once and reused for every completion context. If the persona is
+        # not configured, it is read for each message instead.
+        try:
+            self._persona_message = {
+                "role": "system",
+                "content": self._config.mugen.assistant.persona,
+            }
+        except AttributeError:
+            self._persona_message = None
+
+        # Maximum number of messages kept in an attention thread.
+        # A value of 0 (the default) keeps the full history.
+        self._history_max_length = 0
+        try:
+            history_max_length = int(self._config.mugen.messaging.history.max_length)
+        except AttributeError:
+            pass
+        except (TypeError, ValueError):
+            self._logging_gateway.warning(
+                "Invalid messaging history length. Keeping the full history."
+            )
+        else:
+            self._history_max_length = max(history_max_length, 0)
+
     # pylint: disable=too-many-branches
     # pylint: disable=too-many-statements
     # pylint: disable=too-many-locals
@@ -74,7 +99,9 @@ class DefaultMessagingService(IMessagingService):
             return await self._handle_command(platform, room_id, content.strip())
 
         # Load previous history from storage if it exists.
-        attention_thread = self.load_attention_thread(room_id)
+        # The thread key is resolved once and reused when saving.
+        thread_key = self._get_attention_thread_key(room_id)
+        attention_thread = self._load_thread(thread_key)
 
         # self._logging_gateway.debug(f"attention_thread: {attention_thread}")
 
@@ -83,36 +110,36 @@ class DefaultMessagingService(IMessagingService):
         # Add system context to completion context.
         completion_context += self._get_system_context(platform, sender)
 
-        # Add user message to attention thread.
-        attention_thread["messages"].append({"role": "user", "content": content})
+        # The user message is added to the attention thread together with the
+        # assistant response, so that the thread is only persisted once.
+        user_message = {"role": "user", "content": content}
 
         # Log user message if conversation debugging flag set.
         if self._config.mugen.debug_conversation:
             self._logging_gateway.debug(
-                json.dumps(attention_thread["messages"], indent=4)
+                json.dumps(attention_thread["messages"] + [user_message], indent=4)
             )
 
-        # Add thread history to completion context.
+        # Add thread history and user message to completion context.
         completion_context += attention_thread["messages"]
+        completion_context.append(user_message)
 
         # Execute RAG pipelines and get data if any was found.
         # If the user message did not trigger an RAG queries, the information from
         # previous successful queries will still be cached.
-        for rag_ext in self._rag_extensions:
-            # Filter extensions that don't support the
-            # calling platform.
-            if not rag_ext.platform_supported(platform):
-                continue
+        # Filter extensions that don't support the calling platform.
+        rag_extensions = [
+            x for x in self._rag_extensions if x.platform_supported(platform)
+        ]
 
-            await rag_ext.retrieve(sender, content)
-            if self._keyval_storage_gateway.has_key(rag_ext.cache_key):
-                rp_cache = pickle.loads(
-                    self._keyval_storage_gateway.get(
-                        rag_ext.cache_key,
-                        False,
-                    )
-                )
-                completion_context += rp_cache
+        # The pipelines are independent of each other, so they are run
+        # concurrently before their caches are read.
+        await asyncio.gather(*[x.retrieve(sender, content) for x in rag_extensions])
+
+        for rag_ext in rag_extensions:
+            rp_cache = self._keyval_storage_gateway.get(rag_ext.cache_key, False)
+            if rp_cache is not None:
+                completion_context += pickle.loads(rp_cache)
 
         # self._logging_gateway.debug(json.dumps(completion_context, indent=4))
         # Get assistant response based on conversation history, system context,
@@ -126,20 +153,20 @@ class DefaultMessagingService(IMessagingService):
         # will be aware of the failure.
         if completion is None:
             self._logging_gateway.debug("Completion is None.")
-            completion = SimpleNamespace()
-            completion.content = "Error"
-
-        assistant_response = completion.content
+            assistant_response = "Error"
+        else:
+            assistant_response = completion.content
 
         # Save current thread first.
         self._logging_gateway.debug("Persist attention thread.")
-        attention_thread["messages"].append(
+        attention_thread["messages"] += [
+            user_message,
             {
                 "role": "assistant",
                 "content": assistant_response,
-            }
-        )
-        self.save_attention_thread(room_id, attention_thread)
+            },
+        ]
+        self._save_thread(thread_key, attention_thread)
 
         # Log assistant message if conversation debugging flag set.
         if self._config.mugen.debug_conversation:
@@ -187,17 +214,19 @@ class DefaultMessagingService(IMessagingService):
 
     def add_message_to_thread(self, message: str, role: str, room_id: str) -> None:
         # Load the attention thread.
-        attention_thread = self.load_attention_thread(room_id)
+        thread_key = self._get_attention_thread_key(room_id)
+        attention_thread = self._load_thread(thread_key)
 
         # Append a new assistant response.
         attention_thread["messages"].append({"role": role, "content": message})
 
         # Persist the attention thread.
-        self.save_attention_thread(room_id, attention_thread)
+        self._save_thread(thread_key, attention_thread)
 
     def clear_attention_thread(self, room_id: str, keep: int = 0) -> None:
         # Get the attention thread.
-        attention_thread = self.load_attention_thread(room_id)
+        thread_key = self._get_attention_thread_key(room_id)
+        attention_thread = self._load_thread(thread_key)
 
         if keep == 0:
             attention_thread["messages"] = []
@@ -205,16 +234,13 @@ class DefaultMessagingService(IMessagingService):
             attention_thread["messages"] = attention_thread["messages"][-abs(keep) :]
 
         # Persist the cleared thread.
-        self.save_attention_thread(room_id, attention_thread)
+        self._save_thread(thread_key, attention_thread)
 
     def load_attention_thread(self, room_id: str) -> dict | None:
-        thread_key = self._get_attention_thread_key(room_id)
-        return pickle.loads(self._keyval_storage_gateway.get(thread_key, False))
+        return self._load_thread(self._get_attention_thread_key(room_id))
 
     def save_attention_thread(self, room_id: str, thread: dict) -> None:
-        thread["last_saved"] = datetime.now().strftime("%s")
-        thread_key = self._get_attention_thread_key(room_id)
-        self._keyval_storage_gateway.put(thread_key, pickle.dumps(thread))
+        self._save_thread(self._get_attention_thread_key(room_id), thread)
 
     @property
     def mh_extensions(self) -> list[IMHExtension]:
@@ -253,8 +279,10 @@ class DefaultMessagingService(IMessagingService):
         # Get the key to retrieve the list of attention threads for this room.
         thread_list_key = f"chat_threads_list:{room_id}"
 
+        thread_list = self._keyval_storage_gateway.get(thread_list_key, False)
+
         # If thread_list_key does not exist.
-        if not self._keyval_storage_gateway.has_key(thread_list_key):
+        if thread_list is None:
             # This is the first message in this room.
             # Create a new thread list and get the attention thread key.
             self._logging_gateway.debug("New room. Generating new list and new thread.")
@@ -262,10 +290,32 @@ class DefaultMessagingService(IMessagingService):
             return thread_key
         # else:
         # The key does exist.
-        thread_list = pickle.loads(
-            self._keyval_storage_gateway.get(thread_list_key, False)
+        return pickle.loads(thread_list)["attention_thread"]
+
+    def _load_thread(self, thread_key: str) -> dict | None:
+        """Load the thread stored at the specified key."""
+        return pickle.loads(self._keyval_storage_gateway.get(thread_key, False))
+
+    def _save_thread(self, thread_key: str, thread: dict) -> None:
+        """Persist a thread at the specified key."""
+        # Only keep the most recent messages if the history is bounded.
+        if self._history_max_length > 0:
+            messages = thread["messages"][-self._history_max_length :]
+
+            # Messages are not always added in user and assistant pairs, so the
+            # kept history is started at the first user message to avoid
+            # keeping a response without the message it answered.
+            start = next(
+                (i for i, x in enumerate(messages) if x["role"] == "user"),
+                0,
+            )
+            thread["messages"] = messages[start:]
+
+        thread["last_saved"] = str(int(time.time()))
+        self._keyval_storage_gateway.put(
+            thread_key,
+            pickle.dumps(thread, protocol=pickle.HIGHEST_PROTOCOL),
         )
-        return thread_list["attention_thread"]
 
     def _generate_thread_list(self, thread_list_key: str, new_list: bool) -> str:
         """Generate a new attention thread key."""
@@ -293,16 +343,23 @@ class DefaultMessagingService(IMessagingService):
             thread_list["threads"].append(thread_key)
 
         # Persist thread list.
-        self._keyval_storage_gateway.put(thread_list_key, pickle.dumps(thread_list))
+        self._keyval_storage_gateway.put(
+            thread_list_key,
+            pickle.dumps(thread_list, protocol=pickle.HIGHEST_PROTOCOL),
+        )
 
         # Default values for attention thread.
+        now = str(int(time.time()))
         attention_thread = {
-            "created": datetime.now().strftime("%s"),
-            "last_saved": datetime.now().strftime("%s"),
+            "created": now,
+            "last_saved": now,
             "messages": [],
             "version": self._thread_version,
         }
-        self._keyval_storage_gateway.put(thread_key, pickle.dumps(attention_thread))
+        self._keyval_storage_gateway.put(
+            thread_key,
+            pickle.dumps(attention_thread, protocol=pickle.HIGHEST_PROTOCOL),
+        )
 
         return thread_key
 
@@ -311,12 +368,15 @@ class DefaultMessagingService(IMessagingService):
         context = []
 
         # Append assistant persona to context.
-        context.append(
-            {
-                "role": "system",
-                "content": self._config.mugen.assistant.persona,
-            }
-        )
+        if self._persona_message is not None:
+            context.append(self._persona_message)
+        else:
+            context.append(
+                {
+                    "role": "system",
+                    "content": self._config.mugen.assistant.persona,
+                }
+            )
 
         # Append information from CTX extensions to context.
         for ctx_ext in self._ctx_extensions:
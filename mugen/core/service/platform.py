@@ -24,7 +24,8 @@ class DefaultPlatformService(IPlatformService):
         return self._config.mugen.platforms
 
     def extension_supported(self, ext) -> bool:
-        return (
-            not ext.platforms
-            or len(list(set(ext.platforms) & set(self.active_platforms))) != 0
+        # isdisjoint stops at the first shared platform and does not build an
+        # intersection set. The active platforms may be a list or a set.
+        return not ext.platforms or not frozenset(ext.platforms).isdisjoint(
+            self.active_platforms
         )
@@ -21,30 +21,57 @@ class DefaultUserService(IUserService):
     ) -> None:
         self._keyval_storage_gateway = keyval_storage_gateway
         self._logging_gateway = logging_gateway
+        self._known_users: dict | None = None
 
     def add_known_user(self, user_id: str, displayname: str, room_id: str) -> None:
-        known_users = self.get_known_users_list()
-        known_users[user_id] = {
+        known_user = {
             "displayname": displayname,
             "dm_id": room_id,
         }
-        self.save_known_users_list(known_users)
 
-    def get_known_users_list(self) -> dict:
-        if self._keyval_storage_gateway.has_key(self._known_users_list_key):
-            return pickle.loads(
-                self._keyval_storage_gateway.get(self._known_users_list_key, False)
-            )
+        # Skip the write if the user is already known with the same details.
+        known_users = self._load_known_users_list()
+        if known_users.get(user_id) == known_user:
+            return
 
-        return {}
+        # The cached entries are not exposed to callers, so a shallow copy of the
+        # cached list is enough here.
+        known_users = dict(known_users)
+        known_users[user_id] = known_user
+        self._write_known_users_list(known_users)
+
+    def get_known_users_list(self) -> dict:
+        # Copy each entry so that callers cannot modify the cached list,
+        # including the details of each user.
+        return {k: dict(v) for k, v in self._load_known_users_list().items()}
 
     def get_user_display_name(self, user_id: str):
-        known_users = self.get_known_users_list()
-        if user_id in known_users.keys():
-            return known_users[user_id]["displayname"]
-        return ""
+        known_users = self._load_known_users_list()
+        return known_users.get(user_id, {}).get("displayname", "")
+
+    def is_known_user(self, user_id: str) -> bool:
+        return user_id in self._load_known_users_list()
 
     def save_known_users_list(self, known_users: dict) -> None:
+        # Cache a copy so that later changes by the caller are not cached.
+        self._write_known_users_list({k: dict(v) for k, v in known_users.items()})
+
+    def _load_known_users_list(self) -> dict:
+        """Get the cached list of known users, loading it from storage if needed."""
+        if self._known_users is None:
+            known_users = self._keyval_storage_gateway.get(
+                self._known_users_list_key, False
+            )
+            self._known_users = (
+                pickle.loads(known_users) if known_users is not None else {}
+            )
+
+        return self._known_users
+
+    def _write_known_users_list(self, known_users: dict) -> None:
+        """Write a list of known users to storage and cache it."""
         self._keyval_storage_gateway.put(
-            self._known_users_list_key, pickle.dumps(known_users)
+            self._known_users_list_key,
+            pickle.dumps(known_users, protocol=pickle.HIGHEST_PROTOCOL),
         )
+        self._known_users = known_users
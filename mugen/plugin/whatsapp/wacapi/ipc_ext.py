@@ -2,7 +2,6 @@
 
 __all__ = ["WhatsAppWACAPIIPCExtension"]
 
-import asyncio
 import json
 from types import SimpleNamespace
 
@@ -58,9 +57,10 @@ class WhatsAppWACAPIIPCExtension(IIPCExtension):
         """Process WhatsApp Cloud API event."""
         # Get message data.
         event = payload["data"]
-        if "messages" in event["entry"][0]["changes"][0]["value"].keys():
-            contact = event["entry"][0]["changes"][0]["value"]["contacts"][0]
-            message = event["entry"][0]["changes"][0]["value"]["messages"][0]
+        value = event["entry"][0]["changes"][0]["value"]
+        if "messages" in value:
+            contact = value["contacts"][0]
+            message = value["messages"][0]
             sender = contact["wa_id"]
 
             if self._config.mugen.beta.active:
@@ -74,8 +74,7 @@ class WhatsAppWACAPIIPCExtension(IIPCExtension):
                     return
 
             # Add user to list of known users if required.
-            known_users = self._user_service.get_known_users_list()
-            if sender not in known_users.keys():
+            if not self._user_service.is_known_user(sender):
                 self._logging_gateway.debug(f"New WhatsApp contact: {sender}")
                 self._user_service.add_known_user(
                     sender,
@@ -103,7 +102,7 @@ class WhatsAppWACAPIIPCExtension(IIPCExtension):
                         )
                         data: dict = json.loads(send)
 
-                        if "error" in data.keys():
+                        if "error" in data:
                             self._logging_gateway.error("Send response to user failed.")
                             self._logging_gateway.error(data["error"])
                         else:
@@ -116,10 +115,10 @@ class WhatsAppWACAPIIPCExtension(IIPCExtension):
                         message_type=message["type"],
                         sender=sender,
                     )
-        elif "statuses" in event["entry"][0]["changes"][0]["value"].keys():
+        elif "statuses" in value:
             # Process message sent, delivered, and read statuses.
             await self._call_message_handlers(
-                message=event["entry"][0]["changes"][0]["value"]["statuses"][0],
+                message=value["statuses"][0],
                 message_type="status",
             )
 
@@ -137,14 +136,10 @@ class WhatsAppWACAPIIPCExtension(IIPCExtension):
             if (
                 handler.platforms == [] or "whatsapp" in handler.platforms
             ) and message_type in handler.message_types:
-                await asyncio.gather(
-                    asyncio.create_task(
-                        handler.handle_message(
-                            room_id=sender,
-                            sender=sender,
-                            message=message,
-                        )
-                    )
+                await handler.handle_message(
+                    room_id=sender,
+                    sender=sender,
+                    message=message,
                 )
                 hits += 1
         if hits == 0:
@@ -1,6 +1,5 @@
 """Provides unit tests for the matrix_webhook endpoint."""
 
-import asyncio
 import unittest
 import unittest.mock
 
@@ -9,6 +8,8 @@ import werkzeug
 import werkzeug.exceptions
 
 from mugen.core.api.endpoint import matrix_webhook
+from mugen.core.contract.extension.ipc import IIPCExtension
+from mugen.core.service.ipc import DefaultIPCService
 
 
 class TestMatrixWebhook(unittest.IsolatedAsyncioTestCase):
@@ -87,33 +88,68 @@ class TestMatrixWebhook(unittest.IsolatedAsyncioTestCase):
         # Create dummy app to get context.
         app = Quart("test_app")
 
-        # Create dummy queue
-        # to use as response queue.
-        queue = asyncio.Queue()
-        get_queue = unittest.mock.Mock()
-        get_queue.return_value = queue
+        # Put a response on the response queue
+        # when the IPC request is handled.
+        async def handle_ipc_request(_platform: str, payload: dict) -> None:
+            await payload["response_queue"].put({"response": "Ok"})
 
         # Use dummy app context.
         async with app.app_context(), app.test_request_context(
             "/matrix/webhook", json={"command": "test_command"}
         ):
             # Patch logger to suppress output, and
-            # Patch asyncio.Queue to return dummy queue.
+            # Patch IPC service to respond to the request.
             with (
-                unittest.mock.patch(target="asyncio.Queue", new=get_queue),
                 unittest.mock.patch(
-                    target="mugen.core.di.container.ipc_service.handle_ipc_request"
+                    target="mugen.core.di.container.ipc_service.handle_ipc_request",
+                    side_effect=handle_ipc_request,
                 ),
                 self.assertNoLogs(),
             ):
-                # This function allows the while loop that checks
-                # the response queue to execute until data is placed
-                # in the queue.
-                async def delayed_put() -> None:
-                    """Delay adding info to response queue."""
-                    await asyncio.sleep(0.1)
-                    await queue.put({"response": "Ok"})
-
-                asyncio.create_task(delayed_put())
                 response = await matrix_webhook()
                 self.assertEqual(response["response"], "Ok")
+
+    async def test_multiple_ipc_handlers(self):
+        """Test matrix_webhook response when several extensions handle a command."""
+        # Create dummy app to get context.
+        app = Quart("test_app")
+
+        # Dummy IPC extension that responds with its name.
+        class DummyIPCExtension(IIPCExtension):
+            """Dummy IPC extension."""
+
+            def __init__(self, name: str) -> None:
+                self.name = name
+
+            @property
+            def platforms(self) -> list[str]:
+                return []
+
+            @property
+            def ipc_commands(self) -> list[str]:
+                return ["test_command"]
+
+            async def process_ipc_command(self, payload: dict) -> None:
+                await payload["response_queue"].put({"response": self.name})
+
+        # Register two extensions for the same command.
+        ipc_service = DefaultIPCService(logging_gateway=unittest.mock.Mock())
+
+        # Use dummy app context.
+        async with app.app_context(), app.test_request_context(
+            "/matrix/webhook", json={"command": "test_command"}
+        ):
+            with (
+                unittest.mock.patch.object(
+                    target=DefaultIPCService,
+                    attribute="_ipc_extensions",
+                    new=[],
+                ),
+                self.assertNoLogs(),
+            ):
+                ipc_service.register_ipc_extension(DummyIPCExtension("first"))
+                ipc_service.register_ipc_extension(DummyIPCExtension("second"))
+
+                # The first response is returned.
+                response = await matrix_webhook(ipc_service=ipc_service)
+                self.assertEqual(response["response"], "first")
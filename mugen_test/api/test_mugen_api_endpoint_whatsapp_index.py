@@ -1,6 +1,5 @@
 """Provides unit tests for the whatsapp_index endpoint."""
 
-import asyncio
 import unittest
 import unittest.mock
 
@@ -32,29 +31,19 @@ class TestWhatsAppIndex(unittest.IsolatedAsyncioTestCase):
         # Create dummy app to get context.
         app = Quart("test_app")
 
-        # Create dummy queue
-        # to use as response queue.
-        queue = asyncio.Queue()
-        get_queue = unittest.mock.Mock()
-        get_queue.return_value = queue
+        # Put a response on the response queue
+        # when the IPC request is handled.
+        async def handle_ipc_request(_platform: str, payload: dict) -> None:
+            await payload["response_queue"].put({"response": "Ok"})
 
         # Use dummy app context.
         async with app.app_context():
             with (
-                unittest.mock.patch(target="asyncio.Queue", new=get_queue),
                 unittest.mock.patch(
-                    target="mugen.core.di.container.ipc_service.handle_ipc_request"
+                    target="mugen.core.di.container.ipc_service.handle_ipc_request",
+                    side_effect=handle_ipc_request,
                 ),
                 self.assertNoLogs(),
             ):
-                # This function allows the while loop that checks
-                # the response queue to execute until data is placed
-                # in the queue.
-                async def delayed_put() -> None:
-                    """Delay adding info to response queue."""
-                    await asyncio.sleep(0.1)
-                    await queue.put({"response": "Ok"})
-
-                asyncio.create_task(delayed_put())
                 response = await whatsapp_index()
                 self.assertEqual(response["status"], "Ok")
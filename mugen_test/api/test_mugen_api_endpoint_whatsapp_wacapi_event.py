@@ -1,6 +1,6 @@
 """Provides unit tests for the whatsapp_wacapi_event endpoint."""
 
-import asyncio
+import inspect
 import unittest
 import unittest.mock
 
@@ -8,7 +8,10 @@ from quart import Quart
 import werkzeug
 import werkzeug.exceptions
 
-from mugen.core.api.endpoint import whatsapp_wacapi_event
+from mugen.core.api import endpoint
+
+# The decorators have their own tests, so the endpoint is tested without them.
+whatsapp_wacapi_event = inspect.unwrap(endpoint.whatsapp_wacapi_event)
 
 
 class TestWhatsAppWACAPIEvent(unittest.IsolatedAsyncioTestCase):
@@ -70,11 +73,10 @@ class TestWhatsAppWACAPIEvent(unittest.IsolatedAsyncioTestCase):
         # Create dummy request data.
         request_data = '{"test": "data"}'
 
-        # Create dummy queue
-        # to use as response queue.
-        queue = asyncio.Queue()
-        get_queue = unittest.mock.Mock()
-        get_queue.return_value = queue
+        # Put a response on the response queue
+        # when the IPC request is handled.
+        async def handle_ipc_request(_platform: str, payload: dict) -> None:
+            await payload["response_queue"].put({"response": "Ok"})
 
         # Use dummy app context.
         async with (
@@ -85,22 +87,13 @@ class TestWhatsAppWACAPIEvent(unittest.IsolatedAsyncioTestCase):
             ),
         ):
             # Patch logger to suppress output, and
-            # Patch asyncio.Queue to return dummy queue.
+            # Patch IPC service to respond to the request.
             with (
-                unittest.mock.patch(target="asyncio.Queue", new=get_queue),
                 unittest.mock.patch(
-                    target="mugen.core.di.container.ipc_service.handle_ipc_request"
+                    target="mugen.core.di.container.ipc_service.handle_ipc_request",
+                    side_effect=handle_ipc_request,
                 ),
                 self.assertNoLogs(),
             ):
-                # This function allows the while loop that checks
-                # the response queue to execute until data is placed
-                # in the queue.
-                async def delayed_put() -> None:
-                    """Delay adding info to response queue."""
-                    await asyncio.sleep(0.1)
-                    await queue.put({"response": "Ok"})
-
-                asyncio.create_task(delayed_put())
                 response = await whatsapp_wacapi_event()
                 self.assertEqual(response["response"], "Ok")
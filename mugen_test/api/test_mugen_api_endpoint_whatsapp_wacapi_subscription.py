@@ -9,11 +9,15 @@ import werkzeug
 import werkzeug.exceptions
 
 from mugen.core.api.endpoint import whatsapp_wacapi_subscription
+from mugen_test.util import isolate_allow_list
 
 
 class TestWhatsAppWACAPISubscription(unittest.IsolatedAsyncioTestCase):
     """Unit tests for the whatsapp_wacapi_subscription endpoint."""
 
+    def setUp(self) -> None:
+        isolate_allow_list(self)
+
     async def test_hub_mode_unavailable_or_incorrect(self):
         """Test response when hub.mode is unavailable or incorrect."""
         # Create dummy app to get context.
@@ -109,6 +113,36 @@ class TestWhatsAppWACAPISubscription(unittest.IsolatedAsyncioTestCase):
             ):
                 await whatsapp_wacapi_subscription(config=None)
 
+    async def test_config_verification_token_not_string(self):
+        """Test response when config verification token is not a string."""
+        # Create dummy app to get context.
+        app = Quart("test_app")
+
+        # Create dummy config with an unset verification token.
+        config = SimpleNamespace(
+            whatsapp=SimpleNamespace(
+                webhook=SimpleNamespace(
+                    verification_token=None,
+                ),
+            ),
+        )
+
+        # Use dummy app context.
+        async with app.app_context(), app.test_request_context(
+            "/whatsapp/wacapi/webhook",
+            query_string={
+                "hub.mode": "subscribe",
+                "hub.verify_token": "test",
+            },
+        ):
+            # Patch logger to suppress output, and
+            # Expect Internal Server Error.
+            with (
+                self.assertLogs(logger="test_app", level="ERROR"),
+                self.assertRaises(werkzeug.exceptions.InternalServerError),
+            ):
+                await whatsapp_wacapi_subscription(config=config)
+
     async def test_hub_verify_token_incorrect(self):
         """Test response when hub.verify_token is incorrect."""
         # Create dummy app to get context.
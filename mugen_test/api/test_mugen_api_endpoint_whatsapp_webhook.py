@@ -1,6 +1,5 @@
 """Provides unit tests for the whatsapp_webhook endpoint."""
 
-import asyncio
 import unittest
 import unittest.mock
 
@@ -93,10 +92,10 @@ class TestWhatsAppWebhook(unittest.IsolatedAsyncioTestCase):
         # Create dummy app to get context.
         app = Quart("test_app")
 
-        # Create dummy queue to use as response queue.
-        queue = asyncio.Queue()
-        get_queue = unittest.mock.Mock()
-        get_queue.return_value = queue
+        # Put a response on the response queue
+        # when the IPC request is handled.
+        async def handle_ipc_request(_platform: str, payload: dict) -> None:
+            await payload["response_queue"].put({"response": "Ok"})
 
         # Use dummy app context.
         async with (
@@ -106,22 +105,13 @@ class TestWhatsAppWebhook(unittest.IsolatedAsyncioTestCase):
             ),
         ):
             # Patch logger to suppress output, and
-            # Patch asyncio.Queue to return dummy queue.
+            # Patch IPC service to respond to the request.
             with (
-                unittest.mock.patch(target="asyncio.Queue", new=get_queue),
                 unittest.mock.patch(
-                    target="mugen.core.di.container.ipc_service.handle_ipc_request"
+                    target="mugen.core.di.container.ipc_service.handle_ipc_request",
+                    side_effect=handle_ipc_request,
                 ),
                 self.assertNoLogs(),
             ):
-                # This function allows the while loop that checks
-                # the response queue to execute until data is placed
-                # in the queue.
-                async def delayed_put() -> None:
-                    """Delay adding info to response queue."""
-                    await asyncio.sleep(0.1)
-                    await queue.put({"response": "Ok"})
-
-                asyncio.create_task(delayed_put())
                 response = await whatsapp_webhook()
                 self.assertEqual(response["response"], "Ok")
@@ -5,7 +5,7 @@ import unittest
 import unittest.mock
 
 
-def dummy_decorator(arg=None, **_dargs):
+def dummy_decorator(**_dargs):
     """Dummy decorator."""
 
     def decorator(func):
@@ -15,9 +15,6 @@ def dummy_decorator(arg=None, **_dargs):
 
         return wrapper
 
-    if callable(arg):
-        return decorator(arg)
-
     return decorator
 
 
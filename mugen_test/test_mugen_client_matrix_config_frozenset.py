@@ -0,0 +1,38 @@
+"""Provides unit tests for mugen.core.client.matrix._config_frozenset."""
+
+from types import SimpleNamespace
+import unittest
+
+from mugen.core.client.matrix import _config_frozenset
+
+
+# pylint: disable=protected-access
+class TestMatrixClientConfigFrozenset(unittest.TestCase):
+    """Unit tests for mugen.core.client.matrix._config_frozenset."""
+
+    def test_list_configured(self):
+        """Test that a configured list is converted to a frozenset."""
+        config = SimpleNamespace(
+            matrix=SimpleNamespace(domains=SimpleNamespace(allowed=["a", "b"]))
+        )
+
+        self.assertEqual(
+            _config_frozenset(config, "matrix.domains.allowed"),
+            frozenset(["a", "b"]),
+        )
+
+    def test_list_none(self):
+        """Test that a null list results in an empty frozenset."""
+        config = SimpleNamespace(
+            matrix=SimpleNamespace(domains=SimpleNamespace(allowed=None))
+        )
+
+        self.assertEqual(
+            _config_frozenset(config, "matrix.domains.allowed"), frozenset()
+        )
+
+    def test_list_not_set(self):
+        """Test that a missing list results in an empty frozenset."""
+        config = SimpleNamespace(matrix=SimpleNamespace())
+
+        self.assertEqual(_config_frozenset(config, "matrix.beta.users"), frozenset())
@@ -0,0 +1,93 @@
+"""Provides unit tests for DefaultMatrixClient sync token handling."""
+
+import asyncio
+from types import SimpleNamespace
+import unittest
+import unittest.mock
+
+from mugen.core.client.matrix import DefaultMatrixClient
+
+
+def _get_config(flush_interval: int) -> SimpleNamespace:
+    """Create a dummy configuration for testing."""
+    return SimpleNamespace(
+        basedir="",
+        matrix=SimpleNamespace(
+            beta=SimpleNamespace(users=[]),
+            client=SimpleNamespace(user="@assistant:example.com"),
+            domains=SimpleNamespace(allowed=[], denied=[]),
+            homeserver="https://example.com",
+            storage=SimpleNamespace(
+                olm=SimpleNamespace(path=""),
+                sync=SimpleNamespace(flush_interval=flush_interval),
+            ),
+        ),
+        mugen=SimpleNamespace(beta=SimpleNamespace(active=False)),
+    )
+
+
+# pylint: disable=protected-access
+class TestDefaultMatrixClientSyncToken(unittest.IsolatedAsyncioTestCase):
+    """Unit tests for DefaultMatrixClient sync token handling."""
+
+    def _get_client(self, flush_interval: int) -> DefaultMatrixClient:
+        """Create a client with mocked storage."""
+        return DefaultMatrixClient(
+            config=_get_config(flush_interval),
+            keyval_storage_gateway=unittest.mock.Mock(),
+            logging_gateway=unittest.mock.Mock(),
+        )
+
+    async def test_sync_token_written_immediately_by_default(self):
+        """Test that sync tokens are written on every sync without an interval."""
+        client = self._get_client(0)
+
+        await client._cb_sync_response(SimpleNamespace(next_batch="token"))
+
+        client._keyval_storage_gateway.put.assert_called_once_with(
+            client._sync_key, "token"
+        )
+
+    async def test_sync_token_returns_pending_value(self):
+        """Test that the latest sync token is returned before it is written."""
+        client = self._get_client(5)
+
+        await client._cb_sync_response(SimpleNamespace(next_batch="token"))
+
+        client._keyval_storage_gateway.put.assert_not_called()
+        self.assertEqual(client.sync_token, "token")
+
+    async def test_aexit_flushes_sync_token(self):
+        """Test that the pending sync token is written on exit."""
+        client = self._get_client(5)
+        client._sync_token_flusher = asyncio.create_task(
+            client._flush_sync_token_periodically()
+        )
+        flusher = client._sync_token_flusher
+
+        await client._cb_sync_response(SimpleNamespace(next_batch="token"))
+        await client.__aexit__(None, None, None)
+
+        self.assertTrue(flusher.done())
+        client._keyval_storage_gateway.put.assert_called_once_with(
+            client._sync_key, "token"
+        )
+        self.assertIsNone(client._pending_sync_token)
+
+    async def test_flusher_continues_after_failed_write(self):
+        """Test that a failed write is logged and retried on the next flush."""
+        client = self._get_client(0.01)
+        client._keyval_storage_gateway.put.side_effect = [OSError("failed"), None]
+        client._sync_token_flusher = asyncio.create_task(
+            client._flush_sync_token_periodically()
+        )
+
+        await client._cb_sync_response(SimpleNamespace(next_batch="token"))
+        await asyncio.sleep(0.05)
+
+        client._logging_gateway.error.assert_called_once()
+        self.assertEqual(client._keyval_storage_gateway.put.call_count, 2)
+        self.assertIsNone(client._pending_sync_token)
+        self.assertFalse(client._sync_token_flusher.done())
+
+        await client.__aexit__(None, None, None)
@@ -6,7 +6,7 @@ import unittest.mock
 
 from quart import Quart
 
-from mugen import create_quart_app
+from mugen import ConfigurationError, create_quart_app
 
 
 class TestMuGenInitCreateQuartApp(unittest.IsolatedAsyncioTestCase):
@@ -18,7 +18,7 @@ class TestMuGenInitCreateQuartApp(unittest.IsolatedAsyncioTestCase):
             # Create dummy configuration for testing.
             dummy_config = SimpleNamespace()
 
-            with self.assertRaises(SystemExit):
+            with self.assertRaises(ConfigurationError):
                 create_quart_app(config=dummy_config)
         except:  # pylint: disable=bare-except
             # We should not get here because all exceptions
@@ -35,7 +35,7 @@ class TestMuGenInitCreateQuartApp(unittest.IsolatedAsyncioTestCase):
                 ),
             )
 
-            with self.assertRaises(SystemExit):
+            with self.assertRaises(ConfigurationError):
                 create_quart_app(dummy_config)
         except:  # pylint: disable=bare-except
             # We should not get here because all exceptions
@@ -28,3 +28,18 @@ class TestDIBuildConfigProvider(unittest.TestCase):
             # We should not get here if the injector
             # is correctly typed.
             self.fail("Exception raised unexpectedly ")
+
+    def test_platforms_converted_to_frozenset(self) -> None:
+        """Test that configured platforms are stored as a frozenset."""
+        config = {
+            "mugen": {
+                "platforms": ["matrix", "telnet"],
+            },
+        }
+        injector = di.injector.DependencyInjector()
+        di._build_config_provider(config, injector)
+        self.assertEqual(
+            injector.config.mugen.platforms,
+            frozenset(["matrix", "telnet"]),
+        )
+        self.assertIsInstance(injector.config.mugen.platforms, frozenset)
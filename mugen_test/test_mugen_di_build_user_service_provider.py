@@ -258,6 +258,9 @@ class TestDIBuildUserService(unittest.TestCase):
                     def get_user_display_name(self, user_id):
                         pass
 
+                    def is_known_user(self, user_id):
+                        pass
+
                     def save_known_users_list(self, known_users):
                         pass
 
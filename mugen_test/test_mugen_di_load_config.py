@@ -30,7 +30,7 @@ class TestDILoadConfig(unittest.TestCase):
         """
 
         # Create dummy file to patch builtins.open.
-        toml_file = unittest.mock.mock_open(read_data=dedent(toml_content))
+        toml_file = unittest.mock.mock_open(read_data=dedent(toml_content).encode())
 
         # Patch builtins.open in this context.
         with unittest.mock.patch(target="builtins.open", new=toml_file):
@@ -0,0 +1,128 @@
+"""Provides unit tests for mugen.core.gateway.knowledge.qdrant."""
+
+import importlib
+from types import SimpleNamespace
+import unittest
+import unittest.mock
+
+from cachetools import TTLCache
+
+from mugen.core.contract.dto.qdrant.search import QdrantSearchVendorParams
+
+
+def _get_gateway_class() -> type:
+    """Import the Qdrant gateway with its third party dependencies mocked."""
+    exceptions = unittest.mock.Mock()
+    exceptions.ResponseHandlingException = type(
+        "ResponseHandlingException", (Exception,), {}
+    )
+    exceptions.UnexpectedResponse = type("UnexpectedResponse", (Exception,), {})
+    with unittest.mock.patch.dict(
+        "sys.modules",
+        {
+            "qdrant_client": unittest.mock.Mock(),
+            "qdrant_client.http.exceptions": exceptions,
+            "sentence_transformers": unittest.mock.Mock(),
+        },
+    ):
+        module = importlib.import_module("mugen.core.gateway.knowledge.qdrant")
+        return module.QdrantKnowledgeGateway
+
+
+def _get_config(cache: dict | None = None) -> SimpleNamespace:
+    """Create a dummy configuration for testing."""
+    qdrant = SimpleNamespace(api=SimpleNamespace(key="", url=""))
+    if cache is not None:
+        qdrant.search = SimpleNamespace(cache=SimpleNamespace(**cache))
+    return SimpleNamespace(
+        qdrant=qdrant,
+        transformers=SimpleNamespace(hf=SimpleNamespace(home="")),
+    )
+
+
+# pylint: disable=protected-access
+class TestQdrantKnowledgeGatewaySearch(unittest.IsolatedAsyncioTestCase):
+    """Unit tests for QdrantKnowledgeGateway.search."""
+
+    def setUp(self) -> None:
+        self.gateway_class = _get_gateway_class()
+
+    def _get_gateway(self, cache: dict | None = None):
+        """Create a gateway with a mocked search."""
+        gateway = self.gateway_class(_get_config(cache), unittest.mock.Mock())
+        gateway._search = unittest.mock.AsyncMock(
+            side_effect=lambda _params: ["result"]
+        )
+        return gateway
+
+    async def test_cache_disabled_by_default(self):
+        """Test that searches are not cached without cache configuration."""
+        gateway = self._get_gateway()
+        params = QdrantSearchVendorParams("collection", "term")
+
+        await gateway.search(params)
+        await gateway.search(params)
+
+        self.assertIsNone(gateway._search_cache)
+        self.assertEqual(gateway._search.await_count, 2)
+
+    async def test_cache_disabled_by_zero(self):
+        """Test that a zero size or time to live disables the cache."""
+        gateway = self._get_gateway({"maxsize": 0, "ttl": 300})
+        self.assertIsNone(gateway._search_cache)
+
+        gateway = self._get_gateway({"maxsize": 256, "ttl": 0})
+        self.assertIsNone(gateway._search_cache)
+
+    async def test_cache_hit(self):
+        """Test that repeated searches are served from the cache."""
+        gateway = self._get_gateway({"maxsize": 256, "ttl": 300})
+        params = QdrantSearchVendorParams("collection", "term")
+
+        first = await gateway.search(params)
+        second = await gateway.search(params)
+
+        self.assertEqual(first, ["result"])
+        self.assertEqual(second, ["result"])
+        gateway._search.assert_awaited_once()
+
+    async def test_cached_result_not_modified_by_caller(self):
+        """Test that modifying a returned result does not affect the cache."""
+        gateway = self._get_gateway({"maxsize": 256, "ttl": 300})
+        params = QdrantSearchVendorParams("collection", "term")
+
+        (await gateway.search(params)).append("modified")
+        (await gateway.search(params)).clear()
+
+        self.assertEqual(await gateway.search(params), ["result"])
+
+    async def test_cache_key_includes_keywords(self):
+        """Test that searches with different keywords are not shared."""
+        gateway = self._get_gateway({"maxsize": 256, "ttl": 300})
+
+        await gateway.search(
+            QdrantSearchVendorParams("collection", "term", keywords=["a"])
+        )
+        await gateway.search(
+            QdrantSearchVendorParams("collection", "term", keywords=["b"])
+        )
+
+        self.assertEqual(gateway._search.await_count, 2)
+
+    async def test_cache_expiry(self):
+        """Test that cached results expire after their time to live."""
+        gateway = self._get_gateway({"maxsize": 256, "ttl": 300})
+        params = QdrantSearchVendorParams("collection", "term")
+
+        # Use a controllable timer for the cache.
+        now = [0]
+        gateway._search_cache = TTLCache(maxsize=256, ttl=300, timer=lambda: now[0])
+
+        await gateway.search(params)
+        now[0] = 299
+        await gateway.search(params)
+        gateway._search.assert_awaited_once()
+
+        now[0] = 300
+        await gateway.search(params)
+        self.assertEqual(gateway._search.await_count, 2)
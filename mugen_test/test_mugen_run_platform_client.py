@@ -0,0 +1,38 @@
+"""Provides unit tests for mugen._run_platform_client."""
+
+import unittest
+import unittest.mock
+
+from mugen import _run_platform_client
+
+
+# pylint: disable=protected-access
+class TestMuGenRunPlatformClient(unittest.IsolatedAsyncioTestCase):
+    """Unit tests for mugen._run_platform_client."""
+
+    async def test_client_failure_logged(self):
+        """Test that a failing platform client is logged and not raised."""
+        logging_gateway = unittest.mock.Mock()
+
+        async def run_failing_client() -> None:
+            raise RuntimeError("test failure")
+
+        try:
+            await _run_platform_client(run_failing_client, logging_gateway)
+        except:  # pylint: disable=bare-except
+            # We should not get here because the failure
+            # should be handled in the called function.
+            self.fail("Exception raised unexpectedly.")
+
+        logging_gateway.error.assert_called_once()
+        self.assertIn("run_failing_client", logging_gateway.error.call_args.args[0])
+
+    async def test_client_success(self):
+        """Test that a platform client that completes is not logged."""
+        logging_gateway = unittest.mock.Mock()
+        run_client = unittest.mock.AsyncMock()
+
+        await _run_platform_client(run_client, logging_gateway)
+
+        run_client.assert_awaited_once()
+        logging_gateway.error.assert_not_called()
@@ -0,0 +1,101 @@
+"""Provides unit tests for DefaultMessagingService history truncation."""
+
+import pickle
+from types import SimpleNamespace
+import unittest
+import unittest.mock
+
+from mugen.core.service.messaging import DefaultMessagingService
+
+
+def _get_config(max_length=None) -> SimpleNamespace:
+    """Create a dummy configuration for testing."""
+    mugen = SimpleNamespace(assistant=SimpleNamespace(persona="persona"))
+    if max_length is not None:
+        mugen.messaging = SimpleNamespace(
+            history=SimpleNamespace(max_length=max_length)
+        )
+    return SimpleNamespace(mugen=mugen)
+
+
+def _get_thread(length: int) -> dict:
+    """Create a dummy thread of alternating user and assistant messages."""
+    return {
+        "messages": [
+            {
+                "role": "user" if i % 2 == 0 else "assistant",
+                "content": str(i),
+            }
+            for i in range(length)
+        ],
+    }
+
+
+# pylint: disable=protected-access
+class TestDefaultMessagingServiceHistory(unittest.TestCase):
+    """Unit tests for DefaultMessagingService history truncation."""
+
+    def _get_service(self, max_length=None) -> DefaultMessagingService:
+        """Create a messaging service with mocked dependencies."""
+        return DefaultMessagingService(
+            config=_get_config(max_length),
+            completion_gateway=unittest.mock.Mock(),
+            keyval_storage_gateway=unittest.mock.Mock(),
+            logging_gateway=unittest.mock.Mock(),
+            user_service=unittest.mock.Mock(),
+        )
+
+    def _get_saved_messages(self, service: DefaultMessagingService) -> list:
+        """Get the messages of the thread saved to storage."""
+        saved = service._keyval_storage_gateway.put.call_args.args[1]
+        return pickle.loads(saved)["messages"]
+
+    def test_full_history_kept_by_default(self):
+        """Test that the full history is kept when no length is configured."""
+        service = self._get_service()
+        service._save_thread("thread", _get_thread(10))
+
+        self.assertEqual(service._history_max_length, 0)
+        self.assertEqual(len(self._get_saved_messages(service)), 10)
+
+    def test_full_history_kept_for_zero(self):
+        """Test that a length of 0 keeps the full history."""
+        service = self._get_service(0)
+        service._save_thread("thread", _get_thread(10))
+
+        self.assertEqual(len(self._get_saved_messages(service)), 10)
+
+    def test_history_truncated(self):
+        """Test that only the most recent messages are kept."""
+        service = self._get_service(4)
+        service._save_thread("thread", _get_thread(10))
+
+        messages = self._get_saved_messages(service)
+        self.assertEqual([x["content"] for x in messages], ["6", "7", "8", "9"])
+
+    def test_truncated_history_starts_with_user(self):
+        """Test that truncation does not keep a response without its message."""
+        service = self._get_service(3)
+        service._save_thread("thread", _get_thread(10))
+
+        messages = self._get_saved_messages(service)
+        self.assertEqual([x["content"] for x in messages], ["8", "9"])
+
+    def test_unpaired_messages_truncated_at_user(self):
+        """Test truncation of a thread with messages that are not in pairs."""
+        thread = _get_thread(4)
+        thread["messages"].insert(3, {"role": "assistant", "content": "extra"})
+
+        service = self._get_service(4)
+        service._save_thread("thread", thread)
+
+        messages = self._get_saved_messages(service)
+        self.assertEqual([x["content"] for x in messages], ["2", "extra", "3"])
+
+    def test_invalid_length(self):
+        """Test that an invalid length keeps the full history."""
+        for max_length in ("", "invalid", []):
+            service = self._get_service(max_length)
+
+            self.assertEqual(service._history_max_length, 0)
+            service._logging_gateway.warning.assert_called_once()
@@ -0,0 +1,48 @@
+"""Provides unit tests for DefaultMessagingService system context."""
+
+from types import SimpleNamespace
+import unittest
+import unittest.mock
+
+from mugen.core.service.messaging import DefaultMessagingService
+
+
+# pylint: disable=protected-access
+class TestDefaultMessagingServiceSystemContext(unittest.TestCase):
+    """Unit tests for DefaultMessagingService system context."""
+
+    def _get_service(self, config: SimpleNamespace) -> DefaultMessagingService:
+        """Create a messaging service with mocked dependencies."""
+        return DefaultMessagingService(
+            config=config,
+            completion_gateway=unittest.mock.Mock(),
+            keyval_storage_gateway=unittest.mock.Mock(),
+            logging_gateway=unittest.mock.Mock(),
+            user_service=unittest.mock.Mock(),
+        )
+
+    def test_persona_in_context(self):
+        """Test that the configured persona is added to the system context."""
+        config = SimpleNamespace(
+            mugen=SimpleNamespace(assistant=SimpleNamespace(persona="persona")),
+        )
+        service = self._get_service(config)
+
+        with unittest.mock.patch.object(
+            target=DefaultMessagingService,
+            attribute="_ctx_extensions",
+            new=[],
+        ):
+            context = service._get_system_context("matrix", "sender")
+
+        self.assertEqual(context, [{"role": "system", "content": "persona"}])
+
+    def test_persona_not_configured(self):
+        """Test that a missing persona only fails when a message is handled."""
+        try:
+            service = self._get_service(SimpleNamespace(mugen=SimpleNamespace()))
+        except AttributeError:
+            self.fail("Exception raised unexpectedly.")
+
+        with self.assertRaises(AttributeError):
+            service._get_system_context("matrix", "sender")
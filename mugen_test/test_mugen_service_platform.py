@@ -0,0 +1,27 @@
+"""Provides unit tests for DefaultPlatformService."""
+
+from types import SimpleNamespace
+import unittest
+import unittest.mock
+
+from mugen.core.service.platform import DefaultPlatformService
+
+
+class TestDefaultPlatformService(unittest.TestCase):
+    """Unit tests for DefaultPlatformService."""
+
+    def test_extension_supported(self):
+        """Test extension support with list and set active platforms."""
+        for platforms in (["matrix", "whatsapp"], frozenset(["matrix", "whatsapp"])):
+            service = DefaultPlatformService(
+                config=SimpleNamespace(mugen=SimpleNamespace(platforms=platforms)),
+                logging_gateway=unittest.mock.Mock(),
+            )
+
+            self.assertTrue(service.extension_supported(SimpleNamespace(platforms=[])))
+            self.assertTrue(
+                service.extension_supported(SimpleNamespace(platforms=["whatsapp"]))
+            )
+            self.assertFalse(
+                service.extension_supported(SimpleNamespace(platforms=["telnet"]))
+            )
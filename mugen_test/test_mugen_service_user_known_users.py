@@ -0,0 +1,68 @@
+"""Provides unit tests for DefaultUserService known users handling."""
+
+import pickle
+import unittest
+import unittest.mock
+
+from mugen.core.service.user import DefaultUserService
+
+
+# pylint: disable=protected-access
+class TestDefaultUserServiceKnownUsers(unittest.TestCase):
+    """Unit tests for DefaultUserService known users handling."""
+
+    def _get_service(self, known_users: dict) -> DefaultUserService:
+        """Create a user service with mocked storage."""
+        keyval_storage_gateway = unittest.mock.Mock()
+        keyval_storage_gateway.get.return_value = pickle.dumps(known_users)
+        return DefaultUserService(
+            keyval_storage_gateway=keyval_storage_gateway,
+            logging_gateway=unittest.mock.Mock(),
+        )
+
+    def test_add_unchanged_user_skips_write(self):
+        """Test that adding a known user with the same details is not written."""
+        service = self._get_service(
+            {"@user:example.com": {"displayname": "User", "dm_id": "!room"}}
+        )
+
+        service.add_known_user("@user:example.com", "User", "!room")
+
+        service._keyval_storage_gateway.put.assert_not_called()
+
+    def test_add_changed_user_written(self):
+        """Test that adding a known user with new details is written."""
+        service = self._get_service(
+            {"@user:example.com": {"displayname": "User", "dm_id": "!room"}}
+        )
+
+        service.add_known_user("@user:example.com", "New Name", "!room")
+
+        service._keyval_storage_gateway.put.assert_called_once()
+        self.assertEqual(service.get_user_display_name("@user:example.com"), "New Name")
+
+    def test_returned_list_does_not_modify_cache(self):
+        """Test that modifying the returned list does not modify the cache."""
+        service = self._get_service(
+            {"@user:example.com": {"displayname": "User", "dm_id": "!room"}}
+        )
+
+        known_users = service.get_known_users_list()
+        known_users["@user:example.com"]["displayname"] = "Modified"
+        known_users["@other:example.com"] = {}
+
+        # The cached details are unchanged, so the write is still skipped.
+        service.add_known_user("@user:example.com", "User", "!room")
+
+        service._keyval_storage_gateway.put.assert_not_called()
+        self.assertEqual(service.get_user_display_name("@user:example.com"), "User")
+        self.assertNotIn("@other:example.com", service.get_known_users_list())
+
+    def test_is_known_user(self):
+        """Test that known users are found without copying the list."""
+        service = self._get_service(
+            {"@user:example.com": {"displayname": "User", "dm_id": "!room"}}
+        )
+
+        self.assertTrue(service.is_known_user("@user:example.com"))
+        self.assertFalse(service.is_known_user("@other:example.com"))
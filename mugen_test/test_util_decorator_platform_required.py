@@ -0,0 +1,111 @@
+"""Provides unit tests for platform_required API decorator."""
+
+from types import SimpleNamespace
+import unittest
+import unittest.mock
+
+from quart import Quart
+import werkzeug
+import werkzeug.exceptions
+
+from mugen_util.decorator import platform_required
+
+
+class TestPlatformRequired(unittest.IsolatedAsyncioTestCase):
+    """Unit tests for platform_required API decorator."""
+
+    async def test_config_variable_not_set(self) -> None:
+        """Test endpoint called when platform configuration is unavailable."""
+        # Create dummy app to get context.
+        app = Quart("test_app")
+
+        # Create dummy config for testing.
+        config = SimpleNamespace()
+
+        # Use dummy context.
+        async with app.app_context():
+
+            # Define and patch dummy endpoint.
+            @platform_required("test", config=config)
+            async def endpoint(*_args, **_kwargs):
+                pass
+
+            # We're supposed to get an exception because the required platform
+            # configuration is not available.
+            with (
+                self.assertLogs(logger="test_app", level="ERROR"),
+                self.assertRaises(werkzeug.exceptions.InternalServerError),
+            ):
+                await endpoint()
+
+    async def test_platform_not_enabled(self) -> None:
+        """Test NotImplemented raised when the platform is not enabled."""
+        # Create dummy app to get context.
+        app = Quart("test_app")
+
+        # Create dummy config for testing.
+        config = SimpleNamespace(
+            mugen=SimpleNamespace(
+                platforms=frozenset(["matrix"]),
+            ),
+        )
+
+        # Use dummy context.
+        async with app.app_context():
+
+            # Define and patch dummy endpoint.
+            @platform_required("test", config=config)
+            async def endpoint(*_args, **_kwargs):
+                pass
+
+            # We must get an exception since the platform is not enabled.
+            with (
+                self.assertLogs(logger="test_app", level="ERROR") as logs,
+                self.assertRaises(werkzeug.exceptions.NotImplemented),
+            ):
+                await endpoint()
+
+            # Unknown platforms are logged using their identifier.
+            self.assertIn("test platform not enabled.", logs.output[0])
+
+    async def test_platform_is_enabled(self) -> None:
+        """Test endpoint called when the platform is enabled."""
+        # Create dummy app to get context.
+        app = Quart("test_app")
+
+        # Create dummy config for testing.
+        config = SimpleNamespace(
+            mugen=SimpleNamespace(
+                platforms=frozenset(["matrix", "test"]),
+            ),
+        )
+
+        # Create a mock to check that the endpoint is called.
+        called = unittest.mock.Mock()
+
+        # Use dummy context.
+        async with app.app_context():
+
+            # Define and patch dummy endpoint.
+            @platform_required("test", config=config)
+            async def endpoint(*_args, **_kwargs):
+                called()
+
+            with self.assertNoLogs():
+                await endpoint()
+
+            called.assert_called_once()
+
+    def test_enabled_platform_endpoint_not_wrapped(self) -> None:
+        """Test endpoint returned unwrapped when the platform is enabled."""
+        # Create dummy config for testing.
+        config = SimpleNamespace(
+            mugen=SimpleNamespace(
+                platforms=frozenset(["test"]),
+            ),
+        )
+
+        async def endpoint(*_args, **_kwargs):
+            pass
+
+        self.assertIs(platform_required("test", config=config)(endpoint), endpoint)
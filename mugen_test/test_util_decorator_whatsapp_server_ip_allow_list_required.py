@@ -8,19 +8,32 @@ from quart import Quart
 import werkzeug
 import werkzeug.exceptions
 
-from mugen_util.decorator import whatsapp_server_ip_allow_list_required
+from mugen_test.util import isolate_allow_list
+from mugen_util.decorator import (
+    _load_allow_list,
+    whatsapp_server_ip_allow_list_required,
+)
 
 
 class TestWhatsAppServerIPAllowListRequired(unittest.IsolatedAsyncioTestCase):
     """Unit tests for whatsapp_server_ip_allow_list_required decorator."""
 
+    def setUp(self) -> None:
+        isolate_allow_list(self)
+
     async def test_config_variable_not_set(self):
         """Test decorator output when whatsapp.servers.allowed is not set."""
         # Create dummy app to get context.
         app = Quart("test_app")
 
         # Create dummy config for testing.
-        config = SimpleNamespace()
+        config = SimpleNamespace(
+            whatsapp=SimpleNamespace(
+                servers=SimpleNamespace(
+                    verify_ip=True,
+                ),
+            ),
+        )
 
         async with app.app_context():
 
@@ -46,6 +59,7 @@ class TestWhatsAppServerIPAllowListRequired(unittest.IsolatedAsyncioTestCase):
             whatsapp=SimpleNamespace(
                 servers=SimpleNamespace(
                     allowed="data/test_file.txt",
+                    verify_ip=True,
                 ),
             ),
         )
@@ -92,6 +106,38 @@ class TestWhatsAppServerIPAllowListRequired(unittest.IsolatedAsyncioTestCase):
             with self.assertLogs(logger="test_app", level="ERROR"):
                 await endpoint()
 
+    async def test_allow_list_not_read_when_verification_not_required(self):
+        """Test that the allow list is ignored when verification is not required."""
+        # Create dummy app to get context.
+        app = Quart("test_app")
+
+        # Create dummy config for testing.
+        config = SimpleNamespace(
+            basedir="",
+            whatsapp=SimpleNamespace(
+                servers=SimpleNamespace(
+                    allowed="",
+                    verify_ip=False,
+                ),
+            ),
+        )
+
+        # Dummy file that is not a valid allow list.
+        dummy_file = unittest.mock.mock_open(read_data="# not a network")
+
+        async with app.app_context():
+
+            # Define and patch dummy endpoint.
+            @unittest.mock.patch(target="builtins.open", new=dummy_file)
+            @whatsapp_server_ip_allow_list_required(config=config)
+            async def endpoint(*_args, **_kwargs):
+                pass
+
+            with self.assertNoLogs():
+                await endpoint()
+
+        dummy_file.assert_not_called()
+
     async def test_verification_required_flag_is_set_invalid_ip(self):
         """Test decorator output when verification is required and ip is invalid."""
         # Create dummy app to get context.
@@ -170,3 +216,18 @@ class TestWhatsAppServerIPAllowListRequired(unittest.IsolatedAsyncioTestCase):
 
             with self.assertNoLogs():
                 await endpoint()
+
+    def test_allow_list_reloaded_when_modified(self):
+        """Test that the allow list is reloaded when the file is modified."""
+        with unittest.mock.patch(
+            target="builtins.open",
+            new=unittest.mock.mock_open(read_data="127.0.0.0/8"),
+        ):
+            networks = _load_allow_list("allowed.txt", 0.0)
+
+        with unittest.mock.patch(
+            target="builtins.open",
+            new=unittest.mock.mock_open(read_data="192.168.0.0/24"),
+        ):
+            self.assertEqual(_load_allow_list("allowed.txt", 0.0), networks)
+            self.assertNotEqual(_load_allow_list("allowed.txt", 1.0), networks)
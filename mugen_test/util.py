@@ -0,0 +1,23 @@
+"""Provides helpers shared by unit tests."""
+
+import unittest
+import unittest.mock
+
+from mugen_util.decorator import _load_allow_list
+
+
+def isolate_allow_list(test_case: unittest.TestCase) -> None:
+    """Clear the allow list cache and patch the allow list modification time.
+
+    Allow lists are cached by path and modification time, and the tests patch
+    the file contents read from paths that may not exist. The modification time
+    is patched with a plain function since some tests set Mock.return_value at
+    class level.
+    """
+    _load_allow_list.cache_clear()
+    patcher = unittest.mock.patch(
+        target="mugen_util.decorator.os.path.getmtime",
+        new=lambda _path: 0.0,
+    )
+    patcher.start()
+    test_case.addCleanup(patcher.stop)
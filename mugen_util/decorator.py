@@ -1,7 +1,6 @@
 """Defines decorators used for API endpoints."""
 
-from functools import wraps
-import hashlib
+from functools import lru_cache, wraps
 import hmac
 import ipaddress
 import os
@@ -11,70 +10,84 @@ from types import SimpleNamespace
 from quart import abort, current_app, request
 
 
-def matrix_platform_required(
-    config: SimpleNamespace = None,
-):
-    """Check that the Matrix platform is enabled."""
+@lru_cache(maxsize=4)
+def _load_allow_list(
+    path: str,
+    mtime: float,  # pylint: disable=unused-argument
+) -> tuple[ipaddress.IPv4Network | ipaddress.IPv6Network, ...]:
+    """Load and parse the networks in an allow list file.
 
-    def decorator(func):
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            try:
-                if "matrix" not in config.mugen.platforms:
-                    current_app.logger.error("Matrix platform not enabled.")
-                    abort(501)
-                return await func(*args, **kwargs)
-            except (AttributeError, KeyError):
-                current_app.logger.error("Could not get platform configuration.")
-                abort(500)
+    The modification time is part of the cache key so that changes to the file
+    are picked up without a restart.
+    """
+    with open(path, "r", encoding="utf8") as f:
+        return tuple(ipaddress.ip_network(l.strip()) for l in f if l.strip())
 
-        return wrapper
 
-    return decorator
+@lru_cache(maxsize=1)
+def _encode_secret(secret: str) -> bytes:
+    """Encode a secret for use as an HMAC key."""
+    return secret.encode("utf8")
 
 
-def telnet_platform_required(
+# Display names used when logging platform errors.
+_PLATFORM_NAMES = {
+    "matrix": "Matrix",
+    "telnet": "Telnet",
+    "whatsapp": "WhatsApp",
+}
+
+
+def platform_required(
+    platform: str,
     config: SimpleNamespace = None,
 ):
-    """Check that the Telnet platform is enabled."""
+    """Check that the specified platform is enabled."""
+    platform_name = _PLATFORM_NAMES.get(platform, platform)
+
+    # The enabled platforms do not change while the application is running,
+    # so they are checked once, when the endpoint is decorated.
+    enabled = False
+    try:
+        enabled = platform in config.mugen.platforms
+        error, status = f"{platform_name} platform not enabled.", 501
+    except (AttributeError, KeyError):
+        error, status = "Could not get platform configuration.", 500
 
     def decorator(func):
+        # Endpoints for enabled platforms are returned unwrapped.
+        if enabled:
+            return func
+
         @wraps(func)
-        async def wrapper(*args, **kwargs):
-            try:
-                if "telnet" not in config.mugen.platforms:
-                    current_app.logger.error("Telnet platform not enabled.")
-                    abort(501)
-                return await func(*args, **kwargs)
-            except (AttributeError, KeyError):
-                current_app.logger.error("Could not get platform configuration.")
-                abort(500)
+        async def wrapper(*_args, **_kwargs):
+            current_app.logger.error(error)
+            abort(status)
 
         return wrapper
 
     return decorator
 
 
-def whatsapp_platform_required(
+def matrix_platform_required(
     config: SimpleNamespace = None,
 ):
-    """Check that the WhatsApp platform is enabled."""
+    """Check that the Matrix platform is enabled."""
+    return platform_required("matrix", config=config)
 
-    def decorator(func):
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            try:
-                if "whatsapp" not in config.mugen.platforms:
-                    current_app.logger.error("WhatsApp platform not enabled.")
-                    abort(501)
-                return await func(*args, **kwargs)
-            except (AttributeError, KeyError):
-                current_app.logger.error("Could not get platform configuration.")
-                abort(500)
 
-        return wrapper
+def telnet_platform_required(
+    config: SimpleNamespace = None,
+):
+    """Check that the Telnet platform is enabled."""
+    return platform_required("telnet", config=config)
 
-    return decorator
+
+def whatsapp_platform_required(
+    config: SimpleNamespace = None,
+):
+    """Check that the WhatsApp platform is enabled."""
+    return platform_required("whatsapp", config=config)
 
 
 def whatsapp_request_signature_verification_required(
@@ -99,13 +112,15 @@ def whatsapp_request_signature_verification_required(
 
             data = await request.get_data()
 
-            hexdigest = hmac.new(
-                app_secret.encode("utf8"),
-                data,
-                hashlib.sha256,
-            ).hexdigest()
+            # Compare raw digests, computed with the one-shot C implementation.
+            digest = hmac.digest(_encode_secret(app_secret), data, "sha256")
+            try:
+                authorized = hmac.compare_digest(bytes.fromhex(xhubsig), digest)
+            except ValueError:
+                # The signature is not a valid hex string.
+                authorized = False
 
-            if not hmac.compare_digest(xhubsig, hexdigest):
+            if not authorized:
                 current_app.logger.error("API call unauthorized.")
                 abort(401)
 
@@ -124,18 +139,6 @@ def whatsapp_server_ip_allow_list_required(
     def decorator(func):
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            try:
-                networks: list
-                with open(
-                    os.path.join(config.basedir, config.whatsapp.servers.allowed),
-                    "r",
-                    encoding="utf8",
-                ) as f:
-                    networks = [l.rstrip() for l in f]
-            except (AttributeError, FileNotFoundError, IsADirectoryError, KeyError):
-                current_app.logger.error("WhatsApp servers allow list not found.")
-                abort(500)
-
             verification_required: str
             try:
                 verification_required = config.whatsapp.servers.verify_ip
@@ -146,14 +149,21 @@ def whatsapp_server_ip_allow_list_required(
                 verification_required = None
 
             if verification_required is True:
-                remote_addr = request.headers["Remote-Addr"]
-                hits = [
-                    x
-                    for x in networks
-                    if ipaddress.ip_address(remote_addr) in ipaddress.ip_network(x)
-                ]
-
-                if len(hits) == 0:
+                # The allow list is only read when it is used.
+                try:
+                    path = os.path.join(config.basedir, config.whatsapp.servers.allowed)
+                    networks = _load_allow_list(path, os.path.getmtime(path))
+                except (AttributeError, FileNotFoundError, IsADirectoryError, KeyError):
+                    current_app.logger.error("WhatsApp servers allow list not found.")
+                    abort(500)
+                except ValueError:
+                    current_app.logger.error("WhatsApp servers allow list invalid.")
+                    abort(500)
+
+                remote_addr = ipaddress.ip_address(request.headers["Remote-Addr"])
+
+                # Stop at the first network containing the remote address.
+                if not any(remote_addr in x for x in networks):
                     current_app.logger.error("Remote address not in allow list.")
                     abort(500)
 
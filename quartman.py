@@ -9,15 +9,28 @@ __email__ = "brightideas@vorsocomputing.com"
 __version__ = "0.37.3"
 
 import asyncio
+import sys
 
-from mugen import create_quart_app, run_clients
+from mugen import ConfigurationError, create_quart_app, run_clients
 
 # Create Quart mugen.
-app = create_quart_app()
+try:
+    app = create_quart_app()
+except ConfigurationError:
+    sys.exit(1)
+
+
+async def run_clients_or_exit() -> None:
+    """Run the clients, exiting the application on configuration errors."""
+    try:
+        await run_clients(app)
+    except ConfigurationError:
+        sys.exit(1)
 
 
 @app.before_serving
 async def startup():
     """Initialise matrix-nio using the Quart event loop."""
-    loop = asyncio.get_event_loop()
-    loop.create_task(run_clients(app))
+    # Keep a reference to the task so that it is not garbage collected while
+    # the clients are running.
+    app.clients_task = asyncio.get_running_loop().create_task(run_clients_or_exit())